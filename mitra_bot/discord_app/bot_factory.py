@@ -8,8 +8,10 @@ from typing import Optional
 
 import discord
 
+from mitra_bot.discord_app.events import register_events
 
-@dataclass
+
+@dataclass(slots=True)
 class AppState:
     channel_id: Optional[int]
     admin_role_name: str
@@ -30,6 +32,7 @@ def create_bot(*, state: AppState) -> discord.Bot:
     bot = discord.Bot(intents=intents)
     bot.state = state  # type: ignore[attr-defined]
 
+    register_events(bot)
     _register_cogs(bot)
     return bot
 
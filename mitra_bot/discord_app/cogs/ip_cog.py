@@ -1,6 +1,7 @@
 # mitra_bot/discord_app/cogs/ip_cog.py
 from __future__ import annotations
 
+import asyncio
 import logging
 
 import discord
@@ -23,6 +24,7 @@ def _format_ip_message(ip: str, *, is_change: bool) -> str:
 class IPCog(commands.Cog):
     def __init__(self, bot: discord.Bot) -> None:
         self.bot = bot
+        self.notifier = Notifier(bot)
 
     ip = discord.SlashCommandGroup(
         name="ip",
@@ -33,7 +35,7 @@ class IPCog(commands.Cog):
     async def status(self, ctx: discord.ApplicationContext):
         await ctx.defer(ephemeral=True)
 
-        ip = get_public_ip()
+        ip = await asyncio.to_thread(get_public_ip)
         if not ip:
             await ctx.respond("Failed to fetch public IP.", ephemeral=True)
             return
@@ -88,8 +90,6 @@ class IPCog(commands.Cog):
 
         msg_body = _format_ip_message(new_ip, is_change=True)
 
-        notifier = Notifier(self.bot)
-
         sent = 0
         for guild in self.bot.guilds:
             per_guild_channel_id = get_notification_channel_id_for_guild(guild.id)
@@ -112,7 +112,7 @@ class IPCog(commands.Cog):
 
                 mention_prefix = f"{role.mention}\n"
 
-            await notifier.send_to_channel(per_guild_channel_id, mention_prefix + msg_body)
+            await self.notifier.send_to_channel(per_guild_channel_id, mention_prefix + msg_body)
             sent += 1
 
         if sent == 0:
@@ -142,6 +142,6 @@ class IPCog(commands.Cog):
                     mention_prefix = f"{role.mention}\n"
                     break
 
-            await notifier.send_to_channel(channel_id, mention_prefix + msg_body)
+            await self.notifier.send_to_channel(channel_id, mention_prefix + msg_body)
 
         await save_ip(new_ip)
@@ -1,6 +1,9 @@
 # mitra_bot/discord_app/cogs/ups_cog.py
 from __future__ import annotations
 
+import asyncio
+import atexit
+import logging
 import re
 from typing import Any, Dict, Optional
 
@@ -15,6 +18,24 @@ from mitra_bot.services.ups.ups_graph import build_ups_status_graph
 from mitra_bot.services.ups.ups_service import UPSConfig, UPSService
 from mitra_bot.storage.cache_store import get_ups_config, set_ups_config
 
+# Upper bound for the live UPS read in /ups status; a stalled USB read must not
+# hold up the interaction.
+LIVE_STATUS_TIMEOUT_SECONDS = 2.0
+
+# Runtime keys seen across the old and new status/log formats.
+_TTE_LOG_KEYS = (
+    "time_to_empty_seconds",
+    "time_to_empty_s",
+    "time_to_empty",
+    "time to empty",
+)
+_TTE_LIVE_KEYS = _TTE_LOG_KEYS + (
+    "status.time_to_empty_seconds",
+    "status.time_to_empty_s",
+    "status.time_to_empty",
+    "status.time to empty",
+)
+
 
 def _fmt_seconds(seconds: Optional[int]) -> str:
     if seconds is None:
@@ -194,6 +215,8 @@ class UPSCog(commands.Cog):
         )
 
         self.log_store.preload_recent(hours=24)
+        # Rows are written in batches; don't lose the pending ones on exit.
+        atexit.register(self.log_store.close)
 
         self.service = UPSService(
             client=self.client,
@@ -201,6 +224,10 @@ class UPSCog(commands.Cog):
             config=self._build_service_config(ups_cfg),
         )
 
+    def cog_unload(self) -> None:
+        atexit.unregister(self.log_store.close)
+        self.log_store.close()
+
     ups = discord.SlashCommandGroup(
         name="ups",
         description="UPS monitoring controls",
@@ -226,10 +253,12 @@ class UPSCog(commands.Cog):
     def _reload_from_cache(self) -> Dict[str, Any]:
         ups_cfg = get_ups_config()
 
-        # Update log store configuration
-        self.log_store.log_path = (
-            Path(str(ups_cfg.get("log_file", "ups_stats.jsonl"))).expanduser().resolve()
-        )
+        # Update log store configuration. This runs before every poll, so only
+        # flush (pending rows belong to the old file) when the path changed.
+        log_path = Path(str(ups_cfg.get("log_file", "ups_stats.jsonl"))).expanduser().resolve()
+        if log_path != self.log_store.log_path:
+            self.log_store.flush()
+            self.log_store.log_path = log_path
         self.log_store.timezone_name = str(ups_cfg.get("timezone", "UTC"))
 
         # Update service config
@@ -315,10 +344,23 @@ class UPSCog(commands.Cog):
             )
             return
 
-        # Get a live snapshot for rich stats (this is what your old command did)
+        # Get a live snapshot for rich stats (this is what your old command did).
+        # The USB read is blocking, so run it off the event loop with a timeout.
         try:
-            live = self.client.get_status()
+            live = await asyncio.wait_for(
+                asyncio.to_thread(self.client.get_status),
+                timeout=LIVE_STATUS_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            logging.warning(
+                "Live UPS read timed out after %ss; using logged data.",
+                LIVE_STATUS_TIMEOUT_SECONDS,
+            )
+            live = {}
         except Exception:
+            # The HID driver can fail in many ways (I/O, report parsing);
+            # any of them just means falling back to logged data.
+            logging.warning("Live UPS read failed; using logged data.", exc_info=True)
             live = {}
 
         # Graph from recent log (also used as fallback for a few values)
@@ -338,17 +380,13 @@ class UPSCog(commands.Cog):
 
         # time-to-empty: support all known key variants and string formats
         tte: Optional[int] = None
-        for key in (
-            "time_to_empty_seconds",
-            "time_to_empty_s",
-            "time_to_empty",
-            "time to empty",
-            "status.time_to_empty_seconds",
-            "status.time_to_empty_s",
-            "status.time_to_empty",
-            "status.time to empty",
-        ):
-            tte = _parse_duration_to_seconds(_get_nested(live, key, None))
+        for key in _TTE_LIVE_KEYS:
+            # Plain top-level keys hit dict.get directly; dotted paths (or a
+            # miss) go through _get_nested for its case-insensitive matching.
+            value = live.get(key) if "." not in key else None
+            if value is None:
+                value = _get_nested(live, key, None)
+            tte = _parse_duration_to_seconds(value)
             if tte is not None:
                 break
 
@@ -358,12 +396,7 @@ class UPSCog(commands.Cog):
         # Fallback to latest log sample if live snapshot does not contain runtime
         if tte is None and recent_rows:
             last = recent_rows[-1]
-            for key in (
-                "time_to_empty_seconds",
-                "time_to_empty_s",
-                "time_to_empty",
-                "time to empty",
-            ):
+            for key in _TTE_LOG_KEYS:
                 tte = _parse_duration_to_seconds(last.get(key))
                 if tte is not None:
                     break
@@ -446,9 +479,16 @@ class UPSCog(commands.Cog):
                 ephemeral=True,
             )
 
-    def poll_for_event(self):
+    async def poll_for_event(self):
         """
         Called by the UPS monitor background loop.
+        Returns None without polling when monitoring is disabled.
+
+        The config reload stays on the event loop, where the /ups commands
+        also reload it; only the blocking HID read + log append run on a
+        worker thread.
         """
-        self._reload_from_cache()
-        return self.service.poll()
+        ups_cfg = self._reload_from_cache()
+        if not bool(ups_cfg.get("enabled", True)):
+            return None
+        return await asyncio.to_thread(self.service.poll)
@@ -0,0 +1,29 @@
+# mitra_bot/discord_app/events.py
+from __future__ import annotations
+
+import discord
+
+from mitra_bot.services.role_manager import invalidate_role_cache
+
+
+def register_events(bot: discord.Bot) -> None:
+    """
+    Register bot-wide listeners that are not owned by a cog.
+    """
+
+    async def on_guild_role_create(role: discord.Role) -> None:
+        invalidate_role_cache(role.guild.id)
+
+    async def on_guild_role_update(before: discord.Role, after: discord.Role) -> None:
+        invalidate_role_cache(after.guild.id)
+
+    async def on_guild_role_delete(role: discord.Role) -> None:
+        invalidate_role_cache(role.guild.id)
+
+    async def on_guild_remove(guild: discord.Guild) -> None:
+        invalidate_role_cache(guild.id)
+
+    bot.add_listener(on_guild_role_create)
+    bot.add_listener(on_guild_role_update)
+    bot.add_listener(on_guild_role_delete)
+    bot.add_listener(on_guild_remove)
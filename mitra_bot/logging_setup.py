@@ -2,7 +2,11 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from pathlib import Path
+from typing import Optional, Set
+
+# Log directories already created by setup_logging (keyed by resolved path).
+_DIR_READY: Set[str] = set()
 
 
 class LogColors:
@@ -56,7 +60,7 @@ def setup_logging(
     """
     Configure root logging similarly to the original bot.py:
       - Console handler with colored formatter
-      - Optional file handler with plain formatter
+      - Optional file handler with plain formatter (opened lazily)
 
     Safe to call multiple times: it clears existing handlers first.
     """
@@ -73,7 +77,13 @@ def setup_logging(
     root_logger.addHandler(console)
 
     if add_file_handler:
-        file_handler = logging.FileHandler(logfile)
+        log_dir = Path(logfile).expanduser().resolve().parent
+        if str(log_dir) not in _DIR_READY:
+            log_dir.mkdir(parents=True, exist_ok=True)
+            _DIR_READY.add(str(log_dir))
+
+        # delay=True: the file is opened on the first emitted record, not here.
+        file_handler = logging.FileHandler(logfile, delay=True)
         file_formatter = logging.Formatter(
             "[%(asctime)s] [%(levelname)-8s] %(name)s: %(message)s",
             datefmt="%Y-%m-%d %H:%M:%S",
@@ -4,22 +4,76 @@ from __future__ import annotations
 import asyncio
 import logging
 from datetime import datetime, timezone
+from typing import Dict
 
+import aiohttp
 import discord
 from mitra_bot.discord_app.bot_factory import AppState, create_bot
 from mitra_bot.logging_setup import setup_logging
-from mitra_bot.storage.cache_schema import RestartNoticeRuntimeModel
+from mitra_bot.storage.cache_schema import RestartNotice
 from mitra_bot.storage.cache_store import (
     clear_power_restart_notice,
     get_notification_channel_map,
     get_power_restart_notice,
 )
 from mitra_bot.settings import load_settings
+from mitra_bot.services.cloudflare_service import BASE_URL, BULK_UPDATE_CONCURRENCY
 from mitra_bot.services.role_manager import ensure_role
 from mitra_bot.tasks.ip_monitor_task import IPMonitorTask
 from mitra_bot.tasks.ups_monitor_task import UPSMonitorTask
 
 
+class _LazyNotifyMap:
+    """Renders the guild->channel map only if the log record is emitted."""
+
+    __slots__ = ("mapping",)
+
+    def __init__(self, mapping: Dict[int, int]) -> None:
+        self.mapping = mapping
+
+    def __str__(self) -> str:
+        return ", ".join(f"{gid}->{cid}" for gid, cid in sorted(self.mapping.items()))
+
+
+def build_restart_embed(notice: RestartNotice, restarted_at_epoch: int) -> discord.Embed:
+    mode = "immediate" if notice.delay_seconds == 0 else "delayed"
+    fields = (
+        ("Action", "`restart`"),
+        ("Mode", f"`{mode}`"),
+        ("Delay", f"`{notice.delay_seconds}` sec"),
+        ("Force", f"`{notice.force}`"),
+        (
+            "Requested By",
+            f"<@{notice.requested_by_user_id}>" if notice.requested_by_user_id else None,
+        ),
+        (
+            "Requested At",
+            f"<t:{notice.requested_at_epoch}:F>" if notice.requested_at_epoch else None,
+        ),
+        (
+            "Confirmed By",
+            f"<@{notice.confirmed_by_user_id}>" if notice.confirmed_by_user_id else None,
+        ),
+        (
+            "Confirmed At",
+            f"<t:{notice.confirmed_at_epoch}:F>" if notice.confirmed_at_epoch else None,
+        ),
+        ("Restarted At", f"<t:{restarted_at_epoch}:F>"),
+    )
+    return discord.Embed.from_dict(
+        {
+            "title": "Restart Completed",
+            "description": "Server restart finished and bot is online.",
+            "color": discord.Color.green().value,
+            "fields": [
+                {"name": name, "value": value, "inline": True}
+                for name, value in fields
+                if value is not None
+            ],
+        }
+    )
+
+
 async def main_async() -> None:
     setup_logging(level=logging.INFO, logfile="bot.log", add_file_handler=True)
 
@@ -33,96 +87,61 @@ async def main_async() -> None:
 
     bot = create_bot(state=state)
 
-    ip_task = IPMonitorTask(bot, interval_seconds=settings.ip_poll_seconds)
-    ups_task = UPSMonitorTask(bot, poll_seconds=settings.ups.poll_seconds)
-
-    started = {"done": False}
+    # One HTTP session for the bot's lifetime, shared by Cloudflare DNS updates.
+    http_session = aiohttp.ClientSession(
+        base_url=BASE_URL,
+        connector=aiohttp.TCPConnector(limit=BULK_UPDATE_CONCURRENCY),
+    )
 
-    @bot.event
-    async def on_ready():
-        if started["done"]:
-            return
-        started["done"] = True
+    ip_task = IPMonitorTask(
+        bot,
+        interval_seconds=settings.ip_poll_seconds,
+        session=http_session,
+    )
+    ups_task = UPSMonitorTask(bot, poll_seconds=settings.ups.poll_seconds)
 
-        logging.info(
-            "Logged in as %s (id=%s)",
-            bot.user,
-            bot.user.id if bot.user else "unknown",
-        )
-        if not bot.intents.members:
-            logging.warning(
-                "Members intent is disabled. Thread leave -> auto-unassign may not work reliably. "
-                "Enable Server Members Intent in Discord portal and set MITRA_ENABLE_MEMBERS_INTENT=true."
-            )
+    ready_event = asyncio.Event()
+    background_tasks: set[asyncio.Task] = set()
 
+    async def _bootstrap_roles() -> None:
         # Ensure roles exist in every guild the bot is in
-        for guild in bot.guilds:
-            await ensure_role(guild, settings.admin_role_name)
-            await ensure_role(guild, settings.ip_subscriber_role_name)
-
-        await ip_task.start()
-        await ups_task.start()
-
+        role_results = await asyncio.gather(
+            *(
+                ensure_role(guild, name)
+                for guild in bot.guilds
+                for name in (settings.admin_role_name, settings.ip_subscriber_role_name)
+            ),
+            return_exceptions=True,
+        )
+        for result in role_results:
+            if isinstance(result, BaseException):
+                logging.error(
+                    "Failed to ensure role on startup.",
+                    exc_info=(type(result), result, result.__traceback__),
+                )
+
+    async def _finalize_restart_notice() -> None:
         restart_notice = get_power_restart_notice()
         if restart_notice:
-            notice = RestartNoticeRuntimeModel.model_validate(restart_notice)
+            notice = RestartNotice.from_mapping(restart_notice)
             channel_id = notice.channel_id
             message_id = notice.message_id
-            delay = notice.delay_seconds
-            force = notice.force
-            requester = notice.requested_by_user_id
-            confirmer = notice.confirmed_by_user_id
-            requested_at_epoch = notice.requested_at_epoch
-            confirmed_at_epoch = notice.confirmed_at_epoch
             restarted_at_epoch = int(datetime.now(timezone.utc).timestamp())
-            mode = "immediate" if delay == 0 else "delayed"
 
             if channel_id and message_id:
                 try:
                     channel = bot.get_channel(int(channel_id))
-                    if channel is None:
+                    if channel is None and settings.strict_restart_notice:
                         channel = await bot.fetch_channel(int(channel_id))
 
-                    if isinstance(channel, (discord.TextChannel, discord.Thread)):
-                        msg = await channel.fetch_message(int(message_id))
-                        embed = discord.Embed(
-                            title="Restart Completed",
-                            description="Server restart finished and bot is online.",
-                            color=discord.Color.green(),
-                        )
-                        embed.add_field(name="Action", value="`restart`", inline=True)
-                        embed.add_field(name="Mode", value=f"`{mode}`", inline=True)
-                        embed.add_field(name="Delay", value=f"`{delay}` sec", inline=True)
-                        embed.add_field(name="Force", value=f"`{force}`", inline=True)
-                        if requester:
-                            embed.add_field(
-                                name="Requested By",
-                                value=f"<@{requester}>",
-                                inline=True,
-                            )
-                        if requested_at_epoch:
-                            embed.add_field(
-                                name="Requested At",
-                                value=f"<t:{int(requested_at_epoch)}:F>",
-                                inline=True,
-                            )
-                        if confirmer:
-                            embed.add_field(
-                                name="Confirmed By",
-                                value=f"<@{confirmer}>",
-                                inline=True,
-                            )
-                        if confirmed_at_epoch:
-                            embed.add_field(
-                                name="Confirmed At",
-                                value=f"<t:{int(confirmed_at_epoch)}:F>",
-                                inline=True,
-                            )
-                        embed.add_field(
-                            name="Restarted At",
-                            value=f"<t:{restarted_at_epoch}:F>",
-                            inline=True,
+                    if channel is None:
+                        logging.warning(
+                            "Restart notice channel %s is not cached; skipping notice edit.",
+                            channel_id,
                         )
+                    elif isinstance(channel, (discord.TextChannel, discord.Thread)):
+                        msg = await channel.fetch_message(int(message_id))
+                        embed = build_restart_embed(notice, restarted_at_epoch)
                         await msg.edit(content=None, embed=embed, view=None)
                     else:
                         logging.warning("Restart notice channel is not a text channel/thread.")
@@ -130,12 +149,54 @@ async def main_async() -> None:
                     logging.exception("Failed to edit restart confirmation message after boot.")
             clear_power_restart_notice()
 
+    async def _startup_background() -> None:
+        results = await asyncio.gather(
+            _bootstrap_roles(),
+            _finalize_restart_notice(),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                logging.error(
+                    "Startup background work failed.",
+                    exc_info=(type(result), result, result.__traceback__),
+                )
+
+    @bot.event
+    async def on_ready():
+        # on_ready fires again on gateway reconnects; only bootstrap once.
+        if ready_event.is_set():
+            return
+        ready_event.set()
+
+        logging.info(
+            "Logged in as %s (id=%s)",
+            bot.user,
+            bot.user.id if bot.user else "unknown",
+        )
+
+        # Monitors don't depend on roles or the restart notice; start them first.
+        await ip_task.start()
+        await ups_task.start()
+
+        if not bot.intents.members:
+            logging.warning(
+                "Members intent is disabled. Thread leave -> auto-unassign may not work reliably. "
+                "Enable Server Members Intent in Discord portal and set MITRA_ENABLE_MEMBERS_INTENT=true."
+            )
+
+        # Role setup and the restart notice edit are independent REST work;
+        # run them together in the background, off the ready path.
+        startup_task = asyncio.create_task(_startup_background())
+        background_tasks.add(startup_task)
+        startup_task.add_done_callback(background_tasks.discard)
+
         per_guild_notify = get_notification_channel_map()
         if per_guild_notify:
-            rendered = ", ".join(
-                f"{gid}->{cid}" for gid, cid in sorted(per_guild_notify.items())
+            logging.info(
+                "Configured notify channels per guild: %s",
+                _LazyNotifyMap(per_guild_notify),
             )
-            logging.info("Configured notify channels per guild: %s", rendered)
         elif settings.channel_id:
             logging.info(
                 "Configured legacy notify channel id: %s (from channel/channel_id)",
@@ -148,7 +209,10 @@ async def main_async() -> None:
 
         logging.info("To-Do lists are managed via per-guild To-Do category and list channels.")
 
-    await bot.start(settings.token)
+    try:
+        await bot.start(settings.token)
+    finally:
+        await http_session.close()
 
 
 def main() -> None:
@@ -15,7 +15,7 @@ class CloudflareAPIEnvelope(BaseModel):
 
 
 class CloudflareDNSRecord(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
     id: str
     type: str
@@ -26,7 +26,7 @@ class CloudflareDNSRecord(BaseModel):
 
 
 class CloudflareZone(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", frozen=True)
 
     id: str
     name: str
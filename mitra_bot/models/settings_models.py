@@ -31,12 +31,15 @@ class AppSettingsModel(BaseModel):
     ups: UPSSettingsModel = Field(default_factory=UPSSettingsModel)
     admin_role_name: str = "Mitra Admin"
     ip_subscriber_role_name: str = "Mitra IP Subscriber"
+    strict_restart_notice: bool = False
 
     @field_validator("channel_id", "channel", mode="before")
     @classmethod
     def parse_channel_id(cls, value: Any) -> Optional[int]:
         if value is None:
             return None
+        if type(value) is int:
+            return value
         try:
             return int(value)
         except Exception:
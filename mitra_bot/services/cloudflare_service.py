@@ -1,11 +1,14 @@
 # mitra_bot/services/cloudflare_service.py
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Type
 
-from pydantic import ValidationError
-import requests
+import aiohttp
+import orjson
+from pydantic import TypeAdapter, ValidationError
 
 from mitra_bot.models.cloudflare_models import (
     CloudflareAPIEnvelope,
@@ -13,7 +16,40 @@ from mitra_bot.models.cloudflare_models import (
     CloudflareZone,
 )
 
-BASE_URL = "https://api.cloudflare.com/client/v4"
+# Sessions are created with this as base_url; endpoints are relative to it.
+BASE_URL = "https://api.cloudflare.com/client/v4/"
+
+_ZONE_LIST = TypeAdapter(List[CloudflareZone])
+_DNS_RECORD_LIST = TypeAdapter(List[CloudflareDNSRecord])
+
+# Cap on concurrent record updates issued by update_dns_records_bulk().
+BULK_UPDATE_CONCURRENCY = 10
+
+
+def _validate_list(
+    adapter: TypeAdapter[List[Any]],
+    model: Type[Any],
+    raw_items: Any,
+    label: str,
+) -> List[Any]:
+    """
+    Validate a Cloudflare result list in one pass, falling back to per-item
+    validation (skipping bad entries) only when the bulk pass fails.
+    """
+    if not isinstance(raw_items, list):
+        return []
+    try:
+        return adapter.validate_python(raw_items)
+    except ValidationError:
+        pass
+
+    out: List[Any] = []
+    for raw in raw_items:
+        try:
+            out.append(model.model_validate(raw))
+        except ValidationError:
+            logging.debug("Skipping invalid Cloudflare %s payload: %s", label, raw)
+    return out
 
 
 class CloudflareService:
@@ -21,7 +57,12 @@ class CloudflareService:
     Thin wrapper around Cloudflare API for:
       - listing zones
       - listing DNS records
-      - updating a DNS record
+      - updating DNS records (one at a time, concurrently, or in one batch)
+
+    All API calls are coroutines on an aiohttp session. Pass ``session`` to
+    share a bot-lifetime session (it must be created with
+    ``base_url=BASE_URL``); otherwise one is created on first use and closed
+    by ``close()`` / ``async with``.
     """
 
     def __init__(
@@ -30,6 +71,7 @@ class CloudflareService:
         *,
         api_key: Optional[str] = None,
         email: Optional[str] = None,
+        session: Optional[aiohttp.ClientSession] = None,
     ) -> None:
         self.api_token = (api_token or "").strip()
         self.api_key = (api_key or "").strip()
@@ -42,21 +84,54 @@ class CloudflareService:
                 "Cloudflare auth is missing. Provide api_token or api_key + email."
             )
 
+        # Credentials are fixed after construction, so build headers once.
+        self._headers: Dict[str, str] = {"Content-Type": "application/json"}
+        if has_token:
+            self._headers["Authorization"] = f"Bearer {self.api_token}"
+        else:
+            self._headers["X-Auth-Key"] = self.api_key
+            self._headers["X-Auth-Email"] = self.email
+
+        self._session = session
+        self._owns_session = session is None
+
+    async def __aenter__(self) -> "CloudflareService":
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """
+        Close the HTTP session if this service created it.
+        """
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
     # --------------------------------------------------
     # Internal helpers
     # --------------------------------------------------
 
-    @property
-    def _headers(self) -> Dict[str, str]:
-        headers: Dict[str, str] = {"Content-Type": "application/json"}
-        if self.api_token:
-            headers["Authorization"] = f"Bearer {self.api_token}"
-        else:
-            headers["X-Auth-Key"] = self.api_key
-            headers["X-Auth-Email"] = self.email
-        return headers
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is not None and self._session.closed and not self._owns_session:
+            # A shared session belongs to its creator; don't quietly replace it.
+            raise RuntimeError("The shared Cloudflare HTTP session is closed.")
+        if self._session is None or self._session.closed:
+            # One small keep-alive pool per service, sized to the bulk cap.
+            self._session = aiohttp.ClientSession(
+                base_url=BASE_URL,
+                connector=aiohttp.TCPConnector(limit=BULK_UPDATE_CONCURRENCY),
+            )
+            self._owns_session = True
+        return self._session
 
-    def _request(
+    async def _request(
         self,
         method: str,
         endpoint: str,
@@ -65,74 +140,92 @@ class CloudflareService:
         json_body: Optional[Dict[str, Any]] = None,
         timeout: int = 20,
     ) -> Dict[str, Any]:
-        url = f"{BASE_URL}{endpoint}"
+        logging.debug("Cloudflare %s %s", method, endpoint)
 
-        logging.debug("Cloudflare %s %s", method, url)
-
-        response = requests.request(
+        async with self._get_session().request(
             method,
-            url,
+            endpoint,
             headers=self._headers,
             params=params,
             json=json_body,
-            timeout=timeout,
-        )
-
-        try:
-            raw = response.json()
-        except Exception:
-            logging.error("Cloudflare returned non-JSON response.")
-            response.raise_for_status()
-            raise
+            timeout=aiohttp.ClientTimeout(total=timeout),
+        ) as response:
+            try:
+                raw = orjson.loads(await response.read())
+            except ValueError:
+                logging.error("Cloudflare returned non-JSON response.")
+                response.raise_for_status()
+                raise
 
         try:
-            data = CloudflareAPIEnvelope.model_validate(raw)
+            envelope = CloudflareAPIEnvelope.model_validate(raw)
         except ValidationError:
             logging.error("Cloudflare API response schema validation failed: %s", raw)
             raise
 
-        if not data.success:
+        if not envelope.success:
             logging.error("Cloudflare API error: %s", raw)
             raise RuntimeError(f"Cloudflare API error: {raw}")
 
-        return data.model_dump(mode="json")
+        # The envelope only gates success; hand back the decoded payload as-is
+        # rather than dumping the model back into an equivalent dict.
+        return raw
 
     # --------------------------------------------------
     # Public API
     # --------------------------------------------------
 
-    def get_zones(self) -> List[Dict[str, Any]]:
+    async def get_zones(self) -> List[CloudflareZone]:
         """
         Return all zones available to the API token.
         """
-        data = self._request("GET", "/zones")
-        out: List[Dict[str, Any]] = []
-        for raw in data.get("result", []):
-            try:
-                out.append(CloudflareZone.model_validate(raw).model_dump(mode="json"))
-            except ValidationError:
-                logging.debug("Skipping invalid Cloudflare zone payload: %s", raw)
-        return out
+        data = await self._request("GET", "zones")
+        return _validate_list(_ZONE_LIST, CloudflareZone, data.get("result"), "zone")
 
-    def get_dns_records(self, zone_id: str) -> List[Dict[str, Any]]:
+    async def get_dns_records(
+        self,
+        zone_id: str,
+        *,
+        name: Optional[str] = None,
+        record_type: Optional[str] = None,
+        per_page: int = 100,
+    ) -> List[CloudflareDNSRecord]:
         """
         Return DNS records for a given zone.
+
+        ``name`` / ``record_type`` are filtered server-side; leave both unset to
+        list every record. All result pages are fetched.
         """
-        data = self._request(
-            "GET",
-            f"/zones/{zone_id}/dns_records",
+        params: Dict[str, Any] = {"per_page": per_page}
+        if name:
+            params["name"] = name
+        if record_type:
+            params["type"] = record_type
+
+        raw_records: List[Any] = []
+        page = 1
+        while True:
+            params["page"] = page
+            data = await self._request(
+                "GET",
+                f"zones/{zone_id}/dns_records",
+                params=params,
+            )
+            result = data.get("result")
+            if isinstance(result, list):
+                raw_records.extend(result)
+
+            info = data.get("result_info")
+            total_pages = info.get("total_pages") if isinstance(info, dict) else None
+            if not isinstance(total_pages, int) or page >= total_pages:
+                break
+            page += 1
+
+        return _validate_list(
+            _DNS_RECORD_LIST, CloudflareDNSRecord, raw_records, "DNS record"
         )
-        out: List[Dict[str, Any]] = []
-        for raw in data.get("result", []):
-            try:
-                out.append(
-                    CloudflareDNSRecord.model_validate(raw).model_dump(mode="json")
-                )
-            except ValidationError:
-                logging.debug("Skipping invalid Cloudflare DNS record payload: %s", raw)
-        return out
 
-    def update_dns_record(
+    async def update_dns_record(
         self,
         zone_id: str,
         record_id: str,
@@ -156,9 +249,9 @@ class CloudflareService:
             "proxied": proxied,
         }
 
-        data = self._request(
+        data = await self._request(
             "PUT",
-            f"/zones/{zone_id}/dns_records/{record_id}",
+            f"zones/{zone_id}/dns_records/{record_id}",
             json_body=body,
         )
 
@@ -175,3 +268,95 @@ class CloudflareService:
         except ValidationError:
             logging.debug("Returning unvalidated Cloudflare update payload: %s", result)
             return result if isinstance(result, dict) else {}
+
+    async def update_dns_records_bulk(
+        self,
+        zone_id: str,
+        updates: List[Dict[str, Any]],
+    ) -> List[Any]:
+        """
+        Update several DNS records concurrently.
+
+        Each entry in ``updates`` holds ``record_id``, ``name``, ``record_type``,
+        ``content`` and optionally ``ttl`` / ``proxied``. Results are returned in
+        the same order; a failed update yields its exception instead of a dict.
+        """
+        semaphore = asyncio.Semaphore(BULK_UPDATE_CONCURRENCY)
+
+        async def _update(update: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.update_dns_record(
+                    zone_id,
+                    update["record_id"],
+                    name=update["name"],
+                    record_type=update["record_type"],
+                    content=update["content"],
+                    ttl=update.get("ttl", 1),
+                    proxied=update.get("proxied", False),
+                )
+
+        return await asyncio.gather(
+            *(_update(update) for update in updates),
+            return_exceptions=True,
+        )
+
+    async def batch_update_dns_records(
+        self,
+        zone_id: str,
+        updates: List[Dict[str, Any]],
+    ) -> List[Any]:
+        """
+        Update several DNS records in one request via the batch endpoint.
+
+        ``updates`` uses the same shape as ``update_dns_records_bulk``. If the
+        batch call is rejected (e.g. not available for the account, or one
+        patch is invalid and the batch is rolled back), falls back to
+        concurrent per-record updates so each record succeeds or fails on
+        its own.
+        """
+        if not updates:
+            return []
+
+        patches = [
+            {
+                "id": update["record_id"],
+                "type": update["record_type"],
+                "name": update["name"],
+                "content": update["content"],
+                "ttl": update.get("ttl", 1),
+                "proxied": update.get("proxied", False),
+            }
+            for update in updates
+        ]
+
+        try:
+            data = await self._request(
+                "POST",
+                f"zones/{zone_id}/dns_records/batch",
+                json_body={"patches": patches},
+            )
+        except (aiohttp.ClientError, RuntimeError, ValueError) as e:
+            logging.warning(
+                "Cloudflare batch update failed (%s); falling back to per-record updates.",
+                e,
+            )
+            return await self.update_dns_records_bulk(zone_id, updates)
+
+        result = data.get("result")
+        patched = result.get("patches") if isinstance(result, dict) else None
+        by_id = {
+            str(rec.get("id")): rec
+            for rec in (patched if isinstance(patched, list) else [])
+            if isinstance(rec, dict)
+        }
+
+        out: List[Any] = []
+        for patch in patches:
+            logging.info(
+                "Updated DNS record %s (%s) -> %s",
+                patch["name"],
+                patch["type"],
+                patch["content"],
+            )
+            out.append(by_id.get(patch["id"], patch))
+        return out
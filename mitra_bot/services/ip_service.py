@@ -2,25 +2,53 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+import threading
+import time
+from typing import Any, Dict, Optional
 
 import requests
+from requests.adapters import HTTPAdapter
 
 
 IPIFY_URL = "https://api.ipify.org"
+USER_AGENT = "Mitra-Discord-Bot"
 
+# Reused across polls so the TLS connection to ipify stays warm.
+_SESSION = requests.Session()
+_SESSION.headers.update({"User-Agent": USER_AGENT})
+_SESSION.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=2))
 
-def get_public_ip(timeout: int = 10) -> Optional[str]:
+# Last successful lookup; the lock also makes concurrent lookups single-flight.
+_CACHE: Dict[str, Any] = {"ip": None, "expires": 0.0}
+_CACHE_LOCK = threading.Lock()
+
+
+def get_public_ip(timeout: int = 10, cache_ttl: int = 60) -> Optional[str]:
     """
     Fetch the current public IPv4 address using ipify.
 
+    Successful lookups are cached for ``cache_ttl`` seconds (0 disables the
+    cache). Concurrent callers share a single in-flight request.
+
     Returns:
         str IP address on success
         None on failure
     """
+    with _CACHE_LOCK:
+        if cache_ttl > 0 and time.monotonic() < _CACHE["expires"]:
+            return _CACHE["ip"]
+
+        ip = _fetch_public_ip(timeout)
+        if ip is not None:
+            _CACHE["ip"] = ip
+            _CACHE["expires"] = time.monotonic() + cache_ttl
+        return ip
+
+
+def _fetch_public_ip(timeout: int) -> Optional[str]:
     try:
         logging.debug("Requesting public IP from %s", IPIFY_URL)
-        response = requests.get(IPIFY_URL, timeout=timeout)
+        response = _SESSION.get(IPIFY_URL, timeout=timeout)
         response.raise_for_status()
 
         ip = response.text.strip()
@@ -1,11 +1,15 @@
 # mitra_bot/services/notifier.py
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import Iterable, Optional
+from typing import Dict, Iterable, Optional, Union
 
 import discord
 
+# Cap on concurrent DMs so large subscriber lists don't burst the rate limit.
+DM_CONCURRENCY = 10
+
 
 class Notifier:
     """
@@ -18,32 +22,48 @@ class Notifier:
 
     def __init__(self, bot: discord.Bot) -> None:
         self.bot = bot
+        # Resolved channels, kept for the notifier's lifetime; an entry is
+        # dropped when a send through it fails so it gets re-resolved.
+        self._channel_cache: Dict[int, Union[discord.TextChannel, discord.Thread]] = {}
 
     async def send_to_channel(self, channel_id: Optional[int], message: str) -> None:
         if not channel_id:
             return
 
+        cid = int(channel_id)
         try:
-            channel = self.bot.get_channel(int(channel_id))
+            channel = self._channel_cache.get(cid)
             if channel is None:
-                channel = await self.bot.fetch_channel(int(channel_id))
+                resolved = self.bot.get_channel(cid)
+                if resolved is None:
+                    resolved = await self.bot.fetch_channel(cid)
+
+                if not isinstance(resolved, (discord.TextChannel, discord.Thread)):
+                    logging.warning("Channel %s is not a text channel/thread.", channel_id)
+                    return
+                channel = self._channel_cache[cid] = resolved
 
-            if isinstance(channel, (discord.TextChannel, discord.Thread)):
-                await channel.send(message)
-            else:
-                logging.warning("Channel %s is not a text channel/thread.", channel_id)
+            await channel.send(message)
 
         except Exception:
+            self._channel_cache.pop(cid, None)
             logging.exception("Failed to send message to channel %s", channel_id)
 
     async def dm_subscribers(self, subscriber_ids: Iterable[int], message: str) -> None:
-        for user_id in list(subscriber_ids):
-            try:
-                user = await self.bot.fetch_user(int(user_id))
-                await user.send(message)
-            except Exception:
-                # Common case: user has DMs closed or blocked the bot
-                logging.debug("Failed to DM subscriber %s", user_id)
+        semaphore = asyncio.Semaphore(DM_CONCURRENCY)
+
+        async def _dm_one(user_id: int) -> None:
+            async with semaphore:
+                try:
+                    user = self.bot.get_user(int(user_id))
+                    if user is None:
+                        user = await self.bot.fetch_user(int(user_id))
+                    await user.send(message)
+                except Exception:
+                    # Common case: user has DMs closed or blocked the bot
+                    logging.debug("Failed to DM subscriber %s", user_id)
+
+        await asyncio.gather(*(_dm_one(user_id) for user_id in list(subscriber_ids)))
 
     async def notify(
         self,
@@ -1,12 +1,152 @@
 # mitra_bot/services/power_service.py
 from __future__ import annotations
 
+import ctypes
 import logging
 import os
 import subprocess
+from ctypes import wintypes
 from typing import List
 
 
+# ----- #
+# Native Win32 power calls (avoids spawning shutdown.exe)
+# ----- #
+
+_TOKEN_ADJUST_PRIVILEGES = 0x0020
+_TOKEN_QUERY = 0x0008
+_SE_PRIVILEGE_ENABLED = 0x00000002
+_SE_SHUTDOWN_NAME = "SeShutdownPrivilege"
+_ERROR_ACCESS_DENIED = 5
+_ERROR_SHUTDOWN_IN_PROGRESS = 1190
+_ERROR_NOT_ALL_ASSIGNED = 1300
+# SHTDN_REASON_MAJOR_OTHER | SHTDN_REASON_MINOR_OTHER | SHTDN_REASON_FLAG_PLANNED
+_SHUTDOWN_REASON = 0x00000000 | 0x000000FF | 0x80000000
+
+
+class _LUID(ctypes.Structure):
+    _fields_ = [("LowPart", wintypes.DWORD), ("HighPart", wintypes.LONG)]
+
+
+class _LUID_AND_ATTRIBUTES(ctypes.Structure):
+    _fields_ = [("Luid", _LUID), ("Attributes", wintypes.DWORD)]
+
+
+class _TOKEN_PRIVILEGES(ctypes.Structure):
+    _fields_ = [
+        ("PrivilegeCount", wintypes.DWORD),
+        ("Privileges", _LUID_AND_ATTRIBUTES * 1),
+    ]
+
+
+def _load_win32() -> tuple[ctypes.WinDLL, ctypes.WinDLL]:
+    advapi32 = ctypes.WinDLL("advapi32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+
+    kernel32.GetCurrentProcess.restype = wintypes.HANDLE
+    kernel32.GetCurrentProcess.argtypes = []
+    kernel32.CloseHandle.restype = wintypes.BOOL
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+    advapi32.OpenProcessToken.restype = wintypes.BOOL
+    advapi32.OpenProcessToken.argtypes = [
+        wintypes.HANDLE,
+        wintypes.DWORD,
+        ctypes.POINTER(wintypes.HANDLE),
+    ]
+    advapi32.LookupPrivilegeValueW.restype = wintypes.BOOL
+    advapi32.LookupPrivilegeValueW.argtypes = [
+        wintypes.LPCWSTR,
+        wintypes.LPCWSTR,
+        ctypes.POINTER(_LUID),
+    ]
+    advapi32.AdjustTokenPrivileges.restype = wintypes.BOOL
+    advapi32.AdjustTokenPrivileges.argtypes = [
+        wintypes.HANDLE,
+        wintypes.BOOL,
+        ctypes.POINTER(_TOKEN_PRIVILEGES),
+        wintypes.DWORD,
+        ctypes.c_void_p,
+        ctypes.c_void_p,
+    ]
+    advapi32.InitiateSystemShutdownExW.restype = wintypes.BOOL
+    advapi32.InitiateSystemShutdownExW.argtypes = [
+        wintypes.LPWSTR,
+        wintypes.LPWSTR,
+        wintypes.DWORD,
+        wintypes.BOOL,
+        wintypes.BOOL,
+        wintypes.DWORD,
+    ]
+    advapi32.AbortSystemShutdownW.restype = wintypes.BOOL
+    advapi32.AbortSystemShutdownW.argtypes = [wintypes.LPWSTR]
+    return advapi32, kernel32
+
+
+def _enable_shutdown_privilege(advapi32: ctypes.WinDLL, kernel32: ctypes.WinDLL) -> None:
+    token = wintypes.HANDLE()
+    if not advapi32.OpenProcessToken(
+        kernel32.GetCurrentProcess(),
+        _TOKEN_ADJUST_PRIVILEGES | _TOKEN_QUERY,
+        ctypes.byref(token),
+    ):
+        raise ctypes.WinError(ctypes.get_last_error())
+
+    try:
+        luid = _LUID()
+        if not advapi32.LookupPrivilegeValueW(None, _SE_SHUTDOWN_NAME, ctypes.byref(luid)):
+            raise ctypes.WinError(ctypes.get_last_error())
+
+        privileges = _TOKEN_PRIVILEGES()
+        privileges.PrivilegeCount = 1
+        privileges.Privileges[0].Luid = luid
+        privileges.Privileges[0].Attributes = _SE_PRIVILEGE_ENABLED
+
+        # AdjustTokenPrivileges can succeed without granting the privilege;
+        # GetLastError distinguishes that case.
+        ok = advapi32.AdjustTokenPrivileges(
+            token, False, ctypes.byref(privileges), 0, None, None
+        )
+        error = ctypes.get_last_error()
+        if not ok or error == _ERROR_NOT_ALL_ASSIGNED:
+            raise ctypes.WinError(error)
+    finally:
+        kernel32.CloseHandle(token)
+
+
+def _execute_power_action_native(
+    action: str,
+    *,
+    delay_seconds: int,
+    force: bool,
+) -> None:
+    """
+    Run a power action through advapi32 instead of shutdown.exe.
+
+    Raises OSError if the call fails.
+    """
+    advapi32, kernel32 = _load_win32()
+
+    _enable_shutdown_privilege(advapi32, kernel32)
+
+    if action == "cancel":
+        ok = advapi32.AbortSystemShutdownW(None)
+    else:
+        delay = max(0, int(delay_seconds))
+        ok = advapi32.InitiateSystemShutdownExW(
+            None,
+            None,
+            delay,
+            # shutdown.exe implies /f whenever /t is greater than 0.
+            bool(force or delay > 0),
+            action == "restart",
+            _SHUTDOWN_REASON,
+        )
+
+    if not ok:
+        raise ctypes.WinError(ctypes.get_last_error())
+
+
 def build_power_command(
     action: str,
     *,
@@ -63,13 +203,35 @@ def execute_power_action(
         force=force,
     )
 
-    logging.info("Executing power action: %s", " ".join(cmd))
+    logging.info(
+        "Executing power action natively: action=%s delay=%s force=%s",
+        action,
+        delay_seconds,
+        force,
+    )
 
     try:
-        subprocess.run(cmd, check=True)
-    except subprocess.CalledProcessError as e:
-        logging.exception("Power action failed.")
-        raise RuntimeError(f"Power action failed: {e}") from e
+        _execute_power_action_native(action, delay_seconds=delay_seconds, force=force)
+    except (OSError, AttributeError) as e:
+        winerror = getattr(e, "winerror", None)
+        if winerror == _ERROR_SHUTDOWN_IN_PROGRESS and action != "cancel":
+            logging.info("A shutdown/restart is already scheduled; not scheduling another.")
+            return "A system shutdown or restart is already scheduled."
+        if winerror in (_ERROR_ACCESS_DENIED, _ERROR_NOT_ALL_ASSIGNED):
+            # shutdown.exe runs under the same account and would be denied too.
+            logging.error("Power action denied: missing shutdown privilege.", exc_info=True)
+            raise RuntimeError(f"Power action failed: {e}") from e
+
+        logging.warning(
+            "Native power action failed; falling back to: %s",
+            " ".join(cmd),
+            exc_info=True,
+        )
+        try:
+            subprocess.run(cmd, check=True)
+        except subprocess.CalledProcessError as e:
+            logging.exception("Power action failed.")
+            raise RuntimeError(f"Power action failed: {e}") from e
 
     if action == "cancel":
         return "Shutdown/restart has been canceled."
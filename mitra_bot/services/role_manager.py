@@ -2,16 +2,34 @@
 from __future__ import annotations
 
 import logging
-from typing import Optional
+from typing import Dict, Optional
 
 import discord
 
+# guild_id -> {role_name: role}; invalidated by guild role events.
+_ROLE_CACHE: Dict[int, Dict[str, discord.Role]] = {}
+
+
+def _roles_by_name(guild: discord.Guild) -> Dict[str, discord.Role]:
+    cached = _ROLE_CACHE.get(guild.id)
+    if cached is None:
+        cached = {}
+        for role in guild.roles:
+            # Keep the first match, same as discord.utils.get(guild.roles, name=...)
+            cached.setdefault(role.name, role)
+        _ROLE_CACHE[guild.id] = cached
+    return cached
+
+
+def invalidate_role_cache(guild_id: int) -> None:
+    _ROLE_CACHE.pop(guild_id, None)
+
 
 async def ensure_role(guild: discord.Guild, role_name: str) -> discord.Role:
     """
     Ensure a role exists in the guild. Create it if missing.
     """
-    existing = discord.utils.get(guild.roles, name=role_name)
+    existing = _roles_by_name(guild).get(role_name)
     if existing:
         return existing
 
@@ -25,13 +43,16 @@ async def ensure_role(guild: discord.Guild, role_name: str) -> discord.Role:
         mentionable=True,
         reason="Mitra bot auto-created required role",
     )
+    invalidate_role_cache(guild.id)
     return role
 
 
 def member_has_role(member: discord.Member, role_name: str) -> bool:
+    # Checked by name on the member's own roles: the name map keeps one role
+    # per name, so duplicate-named roles would otherwise be missed.
     return discord.utils.get(member.roles, name=role_name) is not None
 
 
 def get_role_id(guild: discord.Guild, role_name: str) -> Optional[int]:
-    role = discord.utils.get(guild.roles, name=role_name)
+    role = _roles_by_name(guild).get(role_name)
     return role.id if role else None
@@ -2,10 +2,10 @@
 from __future__ import annotations
 
 import logging
+import threading
+import time
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, model_validator
-
 # Optional dependency: tripplite
 try:
     from tripplite import Battery  # type: ignore
@@ -15,24 +15,23 @@ except Exception:
     TRIPPLITE_AVAILABLE = False
 
 
-class UPSRawStatusModel(BaseModel):
-    model_config = ConfigDict(extra="allow")
+def _normalize_raw_status(raw: Any) -> Dict[str, Any]:
+    """
+    Shape a tripplite.Battery.get() result into a plain dict whose
+    status/input/output entries are always dicts. The source is the local
+    driver, so no per-field validation is needed.
+
+    ``raw`` is a fresh dict per read and is normalized in place.
+    """
+    data = raw if isinstance(raw, dict) else {}
+    for key in ("status", "input", "output"):
+        if not isinstance(data.get(key), dict):
+            data[key] = {}
+    return data
 
-    status: Dict[str, Any] = Field(default_factory=dict)
-    input: Dict[str, Any] = Field(default_factory=dict)
-    output: Dict[str, Any] = Field(default_factory=dict)
 
-    @model_validator(mode="before")
-    @classmethod
-    def _normalize(cls, value: Any) -> Dict[str, Any]:
-        data = dict(value) if isinstance(value, dict) else {}
-        if not isinstance(data.get("status"), dict):
-            data["status"] = {}
-        if not isinstance(data.get("input"), dict):
-            data["input"] = {}
-        if not isinstance(data.get("output"), dict):
-            data["output"] = {}
-        return data
+# Reads closer together than this share one HID poll.
+STATUS_CACHE_TTL_SECONDS = 1.0
 
 
 class TrippliteUPSClient:
@@ -40,10 +39,15 @@ class TrippliteUPSClient:
     A small wrapper around tripplite.Battery that:
       - opens lazily
       - retries on OSError by closing/reopening the handle
+      - serializes reads and briefly caches the last status, so concurrent
+        callers (monitor loop, /ups status) share one HID poll
     """
 
     def __init__(self) -> None:
         self._battery: Optional[Any] = None  # Battery instance
+        self._lock = threading.Lock()
+        self._cache: Optional[Dict[str, Any]] = None
+        self._cache_ts = 0.0
 
     @property
     def available(self) -> bool:
@@ -70,13 +74,30 @@ class TrippliteUPSClient:
     def get_status(self) -> Dict[str, Any]:
         """
         Returns the dict from tripplite.Battery.get()
+
+        Callers must treat the result as read-only; it may be shared.
         """
+        cached = self._cache
+        if cached is not None and time.monotonic() - self._cache_ts < STATUS_CACHE_TTL_SECONDS:
+            return cached
+
+        with self._lock:
+            # Another caller may have refreshed while we waited.
+            if self._cache is not None and time.monotonic() - self._cache_ts < STATUS_CACHE_TTL_SECONDS:
+                return self._cache
+
+            status = self._read_status()
+            self._cache = status
+            self._cache_ts = time.monotonic()
+            return status
+
+    def _read_status(self) -> Dict[str, Any]:
         self.open()
         assert self._battery is not None
 
         try:
             raw = self._battery.get()
-            return UPSRawStatusModel.model_validate(raw).model_dump(mode="json")
+            return _normalize_raw_status(raw)
         except OSError as e:
             logging.warning("UPS read error (OSError). Reopening connection. %s", e)
 
@@ -89,4 +110,4 @@ class TrippliteUPSClient:
             self._battery = Battery()
             self._battery.open()
             raw = self._battery.get()
-            return UPSRawStatusModel.model_validate(raw).model_dump(mode="json")
+            return _normalize_raw_status(raw)
@@ -1,66 +1,85 @@
 # mitra_bot/services/ups/ups_graph.py
 from __future__ import annotations
 
-import math
+import functools
 import logging
-from datetime import datetime, timezone
+import math
+import threading
+from datetime import datetime, timezone, tzinfo
 from io import BytesIO
 from typing import Any, Dict, List, Optional, Tuple
 
-import matplotlib
-from pydantic import BaseModel, ConfigDict, model_validator
+import numpy as np
 
-matplotlib.use("Agg")  # headless-safe
-
-import matplotlib.dates as mdates  # noqa: E402
-import matplotlib.pyplot as plt  # noqa: E402
-from matplotlib.dates import ConciseDateFormatter  # noqa: E402
+from .ups_graph_svg import SVGPanel, build_status_svg
+from .ups_time import parse_iso
 
 try:
     from zoneinfo import ZoneInfo
 except Exception:  # pragma: no cover
     ZoneInfo = None  # type: ignore
 
+# Optional dependency: numba (JIT for the per-series stats loop)
+try:
+    import numba  # type: ignore
+    NUMBA_AVAILABLE = True
+except Exception:
+    numba = None  # type: ignore
+    NUMBA_AVAILABLE = False
+
+# Optional dependency: resvg_py (rasterizes the SVG graph; much lighter than
+# matplotlib, which is then only imported if this path fails)
+try:
+    import resvg_py  # type: ignore
+    RESVG_AVAILABLE = True
+except Exception:
+    resvg_py = None  # type: ignore
+    RESVG_AVAILABLE = False
 
-class UPSGraphRowModel(BaseModel):
-    model_config = ConfigDict(extra="allow")
+USE_MATPLOTLIB = not RESVG_AVAILABLE
 
-    ts: str
 
-    @model_validator(mode="before")
-    @classmethod
-    def _normalize_ts(cls, value: Any) -> Dict[str, Any]:
-        if not isinstance(value, dict):
-            raise ValueError("UPS graph row must be an object.")
-        row = dict(value)
-        ts = row.get("ts") or row.get("timestamp") or row.get("time")
-        if not isinstance(ts, str) or not ts.strip():
-            raise ValueError("UPS graph row is missing timestamp.")
-        row["ts"] = ts.strip()
-        return row
+def _row_ts(row: Any) -> Optional[str]:
+    """
+    Return the stripped timestamp of a log row (ts / timestamp / time), or None.
+    """
+    if not isinstance(row, dict):
+        return None
+    ts = row.get("ts") or row.get("timestamp") or row.get("time")
+    if not isinstance(ts, str):
+        return None
+    ts = ts.strip()
+    return ts or None
 
 
-def _parse_to_local_naive(ts: str, tz_name: str) -> Optional[datetime]:
+@functools.lru_cache(maxsize=16)
+def _resolve_tz(tz_name: str) -> Optional[tzinfo]:
     """
-    Parse stored UTC ISO -> convert to tz -> strip tzinfo so matplotlib shows local wall time.
+    ZoneInfo for tz_name, or None if zoneinfo is unavailable or the name is unknown.
     """
-    if not ts:
+    if ZoneInfo is None:
+        return None
+    try:
+        return ZoneInfo(tz_name)
+    except Exception:
         return None
 
-    tzinfo = None
-    if ZoneInfo is not None:
-        try:
-            tzinfo = ZoneInfo(tz_name)
-        except Exception:
-            tzinfo = None
+
+def _parse_to_local_naive(ts: str, tz: Optional[tzinfo]) -> Optional[datetime]:
+    """
+    Parse stored UTC ISO -> convert to tz (UTC if None) -> strip tzinfo so
+    matplotlib shows local wall time.
+    """
+    if not ts:
+        return None
 
     try:
-        dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        dt = parse_iso(ts)
         if dt.tzinfo is None:
             dt = dt.replace(tzinfo=timezone.utc)
 
-        if tzinfo is not None:
-            dt = dt.astimezone(tzinfo)
+        if tz is not None:
+            dt = dt.astimezone(tz)
         else:
             dt = dt.astimezone(timezone.utc)
 
@@ -69,20 +88,130 @@ def _parse_to_local_naive(ts: str, tz_name: str) -> Optional[datetime]:
         return None
 
 
+_NAN = float("nan")
+_MISSING = object()
+
+
 def _to_float(v: Any) -> float:
+    # Log rows are almost always numeric already; skip the try/except for them.
+    if isinstance(v, (int, float)):
+        return float(v)
     try:
         return float(v)
     except Exception:
-        return float("nan")
+        return _NAN
+
+
+# The PNG is ~2600px wide; more points than this only adds line segments.
+MAX_PLOT_POINTS = 3000
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Largest-Triangle-Three-Buckets downsampling.
+
+    Returns the indices of ``n_out`` points (always including the first and
+    last) that best preserve the visual shape of y over x. Inputs must be
+    finite float arrays sorted by x.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    every = (n - 2) / (n_out - 2)
+    out = np.empty(n_out, dtype=np.int64)
+    out[0] = 0
+    a = 0
+
+    for i in range(n_out - 2):
+        # Average of the next bucket is the third triangle vertex.
+        next_start = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        avg_x = x[next_start:next_end].mean()
+        avg_y = y[next_start:next_end].mean()
+
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        areas = np.abs(
+            (x[a] - avg_x) * (y[start:end] - y[a])
+            - (x[a] - x[start:end]) * (avg_y - y[a])
+        )
+        a = start + int(np.argmax(areas))
+        out[i + 1] = a
+
+    out[-1] = n - 1
+    return out
+
+
+def _welford_mean_std(series: np.ndarray) -> Tuple[int, float, float]:
+    """
+    Single-pass (Welford) count / mean / sample std, skipping NaNs.
+    """
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for v in series:
+        if math.isnan(v):
+            continue
+        count += 1
+        delta = v - mean
+        mean += delta / count
+        m2 += delta * (v - mean)
+    if count < 2:
+        return count, mean, 0.0
+    return count, mean, math.sqrt(m2 / (count - 1))
+
+
+if NUMBA_AVAILABLE:
+    _welford_mean_std_jit = numba.njit(cache=True)(_welford_mean_std)
+
 
+def _mean_std(series: np.ndarray, finite: np.ndarray):
+    if NUMBA_AVAILABLE:
+        count, mean, std = _welford_mean_std_jit(series)
+        if count < 2:
+            return None, None
+        return float(mean), float(std)
 
-def _mean_std(series: List[float]):
-    vals = [v for v in series if not math.isnan(v)]
-    if len(vals) < 2:
+    vals = series[finite]
+    if vals.size < 2:
         return None, None
-    mean = sum(vals) / len(vals)
-    std = math.sqrt(sum((v - mean) ** 2 for v in vals) / (len(vals) - 1))
-    return mean, std
+    return float(vals.mean()), float(vals.std(ddof=1))
+
+
+# (values, finite mask, label, units) for one subplot.
+_Series = Tuple[np.ndarray, np.ndarray, str, str]
+
+# ---- Exact original Discord Dark Theme Colors ----
+FIG_BG = "#2B2D31"
+AX_BG = "#313338"
+TEXT = "#DBDEE1"
+GRID = "#4E5058"
+ACCENT = "#5865F2"
+
+# One Figure (and its three Axes) is built lazily and reused for every
+# render; Agg is not reentrant, so renders are serialized by the lock.
+_GRAPH_LOCK = threading.Lock()
+_GRAPH_FIG: Optional[Tuple[Any, Tuple[Any, Any, Any]]] = None
+
+
+def _get_graph_fig() -> Tuple[Any, Tuple[Any, Any, Any]]:
+    global _GRAPH_FIG
+    if _GRAPH_FIG is None:
+        # matplotlib is imported on first use only.
+        import matplotlib
+
+        matplotlib.use("Agg")  # headless-safe
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(12, 7), dpi=220)
+        fig.patch.set_facecolor(FIG_BG)
+
+        ax1 = fig.add_subplot(311)
+        ax2 = fig.add_subplot(312, sharex=ax1)
+        ax3 = fig.add_subplot(313, sharex=ax1)
+        _GRAPH_FIG = (fig, (ax1, ax2, ax3))
+    return _GRAPH_FIG
 
 
 def build_ups_status_graph(
@@ -111,80 +240,160 @@ def build_ups_status_graph(
     if not rows:
         return None
 
+    # Resolve the zone once per render, not once per row.
+    tz = _resolve_tz(timezone_name)
+
     parsed: List[Tuple[datetime, Dict[str, Any]]] = []
     for r in rows:
-        try:
-            norm = UPSGraphRowModel.model_validate(r).model_dump(mode="json")
-        except Exception:
+        ts = _row_ts(r)
+        if ts is None:
             continue
-        dt = _parse_to_local_naive(str(norm.get("ts", "")), timezone_name)
+        dt = _parse_to_local_naive(ts, tz)
         if dt:
-            parsed.append((dt, norm))
+            parsed.append((dt, r))
 
     if len(parsed) < 2:
         return None
 
     parsed.sort(key=lambda x: x[0])
-    xs = [dt for dt, _ in parsed]
 
+    # Each key is probed with a single get(); _MISSING distinguishes an
+    # absent key from a stored null.
     def _get_output_w(row: Dict[str, Any]) -> float:
-        if "output_w" in row:
-            return _to_float(row.get("output_w"))
-        outp = row.get("output") or {}
-        if isinstance(outp, dict) and "power" in outp:
-            return _to_float(outp.get("power"))
-        return float("nan")
+        v = row.get("output_w", _MISSING)
+        if v is not _MISSING:
+            return _to_float(v)
+        outp = row.get("output")
+        if isinstance(outp, dict):
+            v = outp.get("power", _MISSING)
+            if v is not _MISSING:
+                return _to_float(v)
+        return _NAN
 
     def _get_input_v(row: Dict[str, Any]) -> float:
-        if "input_v" in row:
-            return _to_float(row.get("input_v"))
-        inp = row.get("input") or {}
-        if isinstance(inp, dict) and "voltage" in inp:
-            return _to_float(inp.get("voltage"))
-        if "input_voltage" in row:
-            return _to_float(row.get("input_voltage"))
-        return float("nan")
+        v = row.get("input_v", _MISSING)
+        if v is not _MISSING:
+            return _to_float(v)
+        inp = row.get("input")
+        if isinstance(inp, dict):
+            v = inp.get("voltage", _MISSING)
+            if v is not _MISSING:
+                return _to_float(v)
+        v = row.get("input_voltage", _MISSING)
+        if v is not _MISSING:
+            return _to_float(v)
+        return _NAN
 
     def _get_tte_minutes(row: Dict[str, Any]) -> float:
-        # Old log key
-        if "time_to_empty_s" in row:
-            return _to_float(row.get("time_to_empty_s")) / 60.0
-        # Newer key
-        if "time_to_empty_seconds" in row:
-            return _to_float(row.get("time_to_empty_seconds")) / 60.0
-        # Sometimes refactors used this
-        if "time_to_empty" in row:
-            return _to_float(row.get("time_to_empty")) / 60.0
-        return float("nan")
-
-    tte = [_get_tte_minutes(r) for _, r in parsed]
-    out_w = [_get_output_w(r) for _, r in parsed]
-    in_v = [_get_input_v(r) for _, r in parsed]
+        # Old log key, newer key, then what some refactors used
+        for key in ("time_to_empty_s", "time_to_empty_seconds", "time_to_empty"):
+            v = row.get(key, _MISSING)
+            if v is not _MISSING:
+                return _to_float(v) / 60.0
+        return _NAN
+
+    # One pass over the rows into contiguous float arrays (NaN = missing).
+    n = len(parsed)
+    xs = np.array([dt for dt, _ in parsed], dtype="datetime64[us]")
+    tte = np.full(n, np.nan)
+    out_w = np.full(n, np.nan)
+    in_v = np.full(n, np.nan)
+    for i, (_, r) in enumerate(parsed):
+        tte[i] = _get_tte_minutes(r)
+        out_w[i] = _get_output_w(r)
+        in_v[i] = _get_input_v(r)
+
+    # (values, finite mask, label, units) per subplot; each mask is computed
+    # once here and reused for downsampling, stats and y-limits.
+    series: List[_Series] = [
+        (y, ~np.isnan(y), label, units)
+        for y, label, units in (
+            (tte, "Runtime", "min"),
+            (out_w, "Output", "W"),
+            (in_v, "Input", "V"),
+        )
+    ]
 
     # If everything is NaN, skip
-    if (
-        len([v for v in tte if not math.isnan(v)]) < 2
-        and len([v for v in out_w if not math.isnan(v)]) < 2
-        and len([v for v in in_v if not math.isnan(v)]) < 2
-    ):
+    if all(np.count_nonzero(finite) < 2 for _, finite, _, _ in series):
         logging.info("UPS graph: not enough numeric points to graph.")
         return None
 
-    # ---- Exact original Discord Dark Theme Colors ----
-    FIG_BG = "#2B2D31"
-    AX_BG = "#313338"
-    TEXT = "#DBDEE1"
-    GRID = "#4E5058"
-    ACCENT = "#5865F2"
+    label_tz = timezone_name if ZoneInfo is not None else "UTC"
+    x_label = f"Time ({label_tz}) | last {hours}h"
+
+    if not USE_MATPLOTLIB:
+        try:
+            return _render_graph_svg(xs, series, x_label=x_label)
+        except Exception:
+            logging.exception("UPS graph: SVG render failed; using matplotlib.")
+
+    with _GRAPH_LOCK:
+        return _render_graph(xs, series, x_label=x_label)
+
+
+def _plot_indices(
+    xs_num: np.ndarray, y: np.ndarray, finite: np.ndarray
+) -> Optional[np.ndarray]:
+    """
+    Indices of the points to draw when y has more than MAX_PLOT_POINTS
+    finite values (LTTB over the finite points); None means draw all.
+    """
+    if np.count_nonzero(finite) <= MAX_PLOT_POINTS:
+        return None
+    keep = np.flatnonzero(finite)
+    return keep[_lttb_indices(xs_num[keep], y[keep], MAX_PLOT_POINTS)]
 
-    fig = plt.figure(figsize=(12, 7), dpi=220)
-    fig.patch.set_facecolor(FIG_BG)
 
-    ax1 = fig.add_subplot(311)
-    ax2 = fig.add_subplot(312, sharex=ax1)
-    ax3 = fig.add_subplot(313, sharex=ax1)
+def _render_graph_svg(
+    xs: np.ndarray,
+    series: List[_Series],
+    *,
+    x_label: str,
+) -> BytesIO:
+    xs_num = xs.astype(np.int64).astype(np.float64)
+
+    panels = []
+    for y, finite, label, units in series:
+        keep = _plot_indices(xs_num, y, finite)
+        mean, std = _mean_std(y, finite)
+        panels.append(
+            SVGPanel(
+                x=xs_num if keep is None else xs_num[keep],
+                y=y if keep is None else y[keep],
+                label=label,
+                units=units,
+                mean=mean,
+                std=std,
+            )
+        )
+
+    svg = build_status_svg(
+        panels,
+        x_min=float(xs_num[0]),
+        x_max=float(xs_num[-1]),
+        title="Mitra UPS Status",
+        x_label=x_label,
+        theme={"fig_bg": FIG_BG, "ax_bg": AX_BG, "text": TEXT, "grid": GRID, "accent": ACCENT},
+    )
+    # Older resvg_py releases return a list of ints rather than bytes.
+    return BytesIO(bytes(resvg_py.svg_to_bytes(svg_string=svg)))
+
+
+def _render_graph(
+    xs: np.ndarray,
+    series: List[_Series],
+    *,
+    x_label: str,
+) -> BytesIO:
+    import matplotlib.dates as mdates
+    from matplotlib.dates import ConciseDateFormatter
+
+    fig, (ax1, ax2, ax3) = _get_graph_fig()
 
     for ax in (ax1, ax2, ax3):
+        # clear() also resets the styling, so it is reapplied every render.
+        ax.clear()
         ax.set_facecolor(AX_BG)
         ax.tick_params(colors=TEXT, labelsize=9)
         ax.yaxis.label.set_color(TEXT)
@@ -193,10 +402,17 @@ def build_ups_status_graph(
         for spine in ax.spines.values():
             spine.set_color(GRID)
 
-    def _plot(ax, y: List[float], label: str, units: str):
-        ax.plot(xs, y, linewidth=2.2, color=ACCENT, alpha=0.95)
+    xs_num = xs.astype(np.int64).astype(np.float64)
+
+    def _plot(ax, y: np.ndarray, finite: np.ndarray, label: str, units: str):
+        # Downsample only what is drawn; stats below use the full series.
+        keep = _plot_indices(xs_num, y, finite)
+        if keep is not None:
+            ax.plot(xs[keep], y[keep], linewidth=2.2, color=ACCENT, alpha=0.95)
+        else:
+            ax.plot(xs, y, linewidth=2.2, color=ACCENT, alpha=0.95)
 
-        mean, std = _mean_std(y)
+        mean, std = _mean_std(y, finite)
         if mean is not None:
             ax.axhline(mean, linestyle="--", linewidth=1.2, color=TEXT, alpha=0.55)
             if std and std > 0:
@@ -204,16 +420,15 @@ def build_ups_status_graph(
 
         ax.set_ylabel(f"{label}\n({units})", fontsize=10)
 
-        vals = [v for v in y if not math.isnan(v)]
-        if len(vals) >= 2:
-            vmin, vmax = min(vals), max(vals)
+        vals = y[finite]
+        if vals.size >= 2:
+            vmin, vmax = float(vals.min()), float(vals.max())
             if vmin == vmax:
                 pad = 1.0 if vmin == 0 else abs(vmin) * 0.05
                 ax.set_ylim(vmin - pad, vmax + pad)
 
-    _plot(ax1, tte, "Runtime", "min")
-    _plot(ax2, out_w, "Output", "W")
-    _plot(ax3, in_v, "Input", "V")
+    for ax, s in zip((ax1, ax2, ax3), series):
+        _plot(ax, *s)
 
     # ---- Better time axis formatting (original) ----
     locator = mdates.AutoDateLocator(minticks=4, maxticks=8)
@@ -222,16 +437,22 @@ def build_ups_status_graph(
     ax3.xaxis.set_major_formatter(formatter)
 
     for ax in (ax1, ax2):
-        plt.setp(ax.get_xticklabels(), visible=False)
+        for tick_label in ax.get_xticklabels():
+            tick_label.set_visible(False)
 
-    label_tz = timezone_name if ZoneInfo is not None else "UTC"
-    ax3.set_xlabel(f"Time ({label_tz}) | last {hours}h", fontsize=10)
+    ax3.set_xlabel(x_label, fontsize=10)
 
     fig.suptitle("Mitra UPS Status", fontsize=14, fontweight="bold", color=TEXT)
     fig.tight_layout(rect=[0, 0, 1, 0.96])
 
     buf = BytesIO()
-    fig.savefig(buf, format="png", facecolor=FIG_BG, bbox_inches="tight")
-    plt.close(fig)
+    # tight_layout above already fits the margins, so skip bbox_inches="tight"
+    # (a second draw pass); fast zlib level since Discord recompresses anyway.
+    fig.savefig(
+        buf,
+        format="png",
+        facecolor=FIG_BG,
+        pil_kwargs={"compress_level": 1},
+    )
     buf.seek(0)
     return buf
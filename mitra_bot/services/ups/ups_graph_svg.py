@@ -0,0 +1,247 @@
+# mitra_bot/services/ups/ups_graph_svg.py
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from html import escape
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+
+# Same canvas as the matplotlib figure (12x7in @ 220dpi), drawn in a
+# 1200x700 user-space viewBox and scaled up by the rasterizer.
+VIEW_W = 1200
+VIEW_H = 700
+PIXEL_W = 2640
+PIXEL_H = 1540
+
+_LEFT = 92
+_RIGHT = 20
+_TOP = 56
+_BOTTOM = 62
+_GAP = 26
+
+_FONT = "DejaVu Sans, Arial, sans-serif"
+
+# Candidate spacings for the time axis, in seconds.
+_TIME_STEPS = (
+    60, 300, 600, 900, 1800,
+    3600, 2 * 3600, 3 * 3600, 6 * 3600, 12 * 3600,
+    86400, 2 * 86400, 7 * 86400,
+)
+_EPOCH = datetime(1970, 1, 1)
+
+
+@dataclass(slots=True)
+class SVGPanel:
+    """
+    One subplot: y values (NaN = gap) over x in microseconds of local wall time.
+    ``x`` / ``y`` may already be downsampled; ``mean`` / ``std`` describe the
+    full series.
+    """
+
+    x: np.ndarray
+    y: np.ndarray
+    label: str
+    units: str
+    mean: Optional[float] = None
+    std: Optional[float] = None
+
+
+def _nice_step(span: float, target: int) -> float:
+    raw = span / max(target, 1)
+    if raw <= 0:
+        return 1.0
+    mag = 10 ** math.floor(math.log10(raw))
+    for m in (1.0, 2.0, 2.5, 5.0, 10.0):
+        if m * mag >= raw:
+            return m * mag
+    return 10.0 * mag
+
+
+def _y_limits(y: np.ndarray) -> tuple[float, float]:
+    finite = y[~np.isnan(y)]
+    if finite.size == 0:
+        return 0.0, 1.0
+    lo, hi = float(finite.min()), float(finite.max())
+    if lo == hi:
+        pad = 1.0 if lo == 0 else abs(lo) * 0.05
+        return lo - pad, hi + pad
+    # matplotlib's default 5% data margin
+    pad = (hi - lo) * 0.05
+    return lo - pad, hi + pad
+
+
+def _y_ticks(lo: float, hi: float) -> tuple[List[float], int]:
+    step = _nice_step(hi - lo, 5)
+    decimals = max(0, -math.floor(math.log10(step)))
+    scaled = step * 10**decimals
+    if abs(scaled - round(scaled)) > 1e-9:
+        decimals += 1  # e.g. 2.5 / 0.25 steps
+    first = math.ceil(lo / step) * step
+    ticks = []
+    v = first
+    while v <= hi + step * 1e-9:
+        ticks.append(v)
+        v += step
+    return ticks, decimals
+
+
+def _time_ticks(x0_us: float, x1_us: float) -> List[tuple[float, str]]:
+    span_s = (x1_us - x0_us) / 1e6
+    step = next((s for s in _TIME_STEPS if span_s / s <= 8), _TIME_STEPS[-1])
+
+    start_s = math.ceil(x0_us / 1e6 / step) * step
+    ticks = []
+    t = start_s
+    while t * 1e6 <= x1_us:
+        dt = _EPOCH + timedelta(seconds=t)
+        if step >= 86400 or (dt.hour == 0 and dt.minute == 0):
+            label = dt.strftime("%b-%d")
+        else:
+            label = dt.strftime("%H:%M")
+        ticks.append((t * 1e6, label))
+        t += step
+    return ticks
+
+
+def _polylines(px: np.ndarray, py: np.ndarray, finite: np.ndarray) -> List[str]:
+    """
+    Split at NaNs (as matplotlib does) and format each run as a points list.
+    """
+    out: List[str] = []
+    idx = np.flatnonzero(finite)
+    if idx.size == 0:
+        return out
+    breaks = np.flatnonzero(np.diff(idx) > 1) + 1
+    for run in np.split(idx, breaks):
+        if run.size < 2:
+            continue
+        out.append(" ".join(f"{a:.1f},{b:.1f}" for a, b in zip(px[run], py[run])))
+    return out
+
+
+def build_status_svg(
+    panels: Sequence[SVGPanel],
+    *,
+    x_min: float,
+    x_max: float,
+    title: str,
+    x_label: str,
+    theme: Dict[str, str],
+) -> str:
+    """
+    Render stacked line panels sharing one time axis as an SVG document.
+
+    ``theme`` holds the colours: fig_bg, ax_bg, text, grid, accent.
+    """
+    fig_bg = theme["fig_bg"]
+    ax_bg = theme["ax_bg"]
+    text = theme["text"]
+    grid = theme["grid"]
+    accent = theme["accent"]
+
+    # matplotlib's default 5% margin on x as well
+    pad = (x_max - x_min) * 0.05 or 1e6
+    x0, x1 = x_min - pad, x_max + pad
+
+    n = len(panels)
+    plot_w = VIEW_W - _LEFT - _RIGHT
+    panel_h = (VIEW_H - _TOP - _BOTTOM - _GAP * (n - 1)) / max(n, 1)
+    sx = plot_w / (x1 - x0)
+    time_ticks = _time_ticks(x0, x1)
+
+    parts: List[str] = [
+        f'<svg xmlns="http://www.w3.org/2000/svg" width="{PIXEL_W}" height="{PIXEL_H}" '
+        f'viewBox="0 0 {VIEW_W} {VIEW_H}" font-family="{_FONT}">',
+        f'<rect width="{VIEW_W}" height="{VIEW_H}" fill="{fig_bg}"/>',
+        f'<text x="{VIEW_W / 2}" y="30" fill="{text}" font-size="16" '
+        f'font-weight="bold" text-anchor="middle">{escape(title)}</text>',
+    ]
+
+    for i, panel in enumerate(panels):
+        top = _TOP + i * (panel_h + _GAP)
+        bottom = top + panel_h
+        lo, hi = _y_limits(panel.y)
+        sy = panel_h / (hi - lo)
+
+        parts.append(
+            f'<clipPath id="p{i}"><rect x="{_LEFT}" y="{top:.1f}" '
+            f'width="{plot_w}" height="{panel_h:.1f}"/></clipPath>'
+        )
+        parts.append(
+            f'<rect x="{_LEFT}" y="{top:.1f}" width="{plot_w}" height="{panel_h:.1f}" fill="{ax_bg}"/>'
+        )
+
+        # Grid + tick labels
+        y_ticks, decimals = _y_ticks(lo, hi)
+        for v in y_ticks:
+            gy = bottom - (v - lo) * sy
+            parts.append(
+                f'<line x1="{_LEFT}" y1="{gy:.1f}" x2="{_LEFT + plot_w}" y2="{gy:.1f}" '
+                f'stroke="{grid}" stroke-opacity="0.25" stroke-width="0.8"/>'
+            )
+            parts.append(
+                f'<text x="{_LEFT - 6}" y="{gy + 3.5:.1f}" fill="{text}" font-size="9" '
+                f'text-anchor="end">{v:.{decimals}f}</text>'
+            )
+        for t, label in time_ticks:
+            gx = _LEFT + (t - x0) * sx
+            parts.append(
+                f'<line x1="{gx:.1f}" y1="{top:.1f}" x2="{gx:.1f}" y2="{bottom:.1f}" '
+                f'stroke="{grid}" stroke-opacity="0.25" stroke-width="0.8"/>'
+            )
+            if i == n - 1:
+                parts.append(
+                    f'<text x="{gx:.1f}" y="{bottom + 14:.1f}" fill="{text}" font-size="9" '
+                    f'text-anchor="middle">{label}</text>'
+                )
+
+        # Mean line and +/- 1 std band
+        if panel.mean is not None:
+            my = bottom - (panel.mean - lo) * sy
+            if panel.std:
+                band_top = bottom - (panel.mean + panel.std - lo) * sy
+                band_h = 2 * panel.std * sy
+                parts.append(
+                    f'<rect x="{_LEFT}" y="{band_top:.1f}" width="{plot_w}" height="{band_h:.1f}" '
+                    f'fill="{text}" fill-opacity="0.08" clip-path="url(#p{i})"/>'
+                )
+            parts.append(
+                f'<line x1="{_LEFT}" y1="{my:.1f}" x2="{_LEFT + plot_w}" y2="{my:.1f}" '
+                f'stroke="{text}" stroke-opacity="0.55" stroke-width="1.2" '
+                f'stroke-dasharray="5,3" clip-path="url(#p{i})"/>'
+            )
+
+        # Series (vectorized affine transform into viewBox pixels)
+        finite = ~np.isnan(panel.y)
+        px = _LEFT + (panel.x - x0) * sx
+        py = bottom - (panel.y - lo) * sy
+        for points in _polylines(px, py, finite):
+            parts.append(
+                f'<polyline points="{points}" fill="none" stroke="{accent}" '
+                f'stroke-opacity="0.95" stroke-width="2.2" stroke-linejoin="round" '
+                f'clip-path="url(#p{i})"/>'
+            )
+
+        parts.append(
+            f'<rect x="{_LEFT}" y="{top:.1f}" width="{plot_w}" height="{panel_h:.1f}" '
+            f'fill="none" stroke="{grid}"/>'
+        )
+
+        # Two-line y label, rotated like matplotlib's
+        cy = top + panel_h / 2
+        parts.append(
+            f'<text transform="translate(32 {cy:.1f}) rotate(-90)" fill="{text}" '
+            f'font-size="10" text-anchor="middle">'
+            f'<tspan x="0" dy="-0.2em">{escape(panel.label)}</tspan>'
+            f'<tspan x="0" dy="1.2em">({escape(panel.units)})</tspan></text>'
+        )
+
+    parts.append(
+        f'<text x="{_LEFT + plot_w / 2}" y="{VIEW_H - 22}" fill="{text}" font-size="10" '
+        f'text-anchor="middle">{escape(x_label)}</text>'
+    )
+    parts.append("</svg>")
+    return "".join(parts)
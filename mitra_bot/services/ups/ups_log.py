@@ -1,27 +1,54 @@
 # mitra_bot/services/ups/ups_log.py
 from __future__ import annotations
 
+import gzip
 import json
 import logging
+import mmap
+import shutil
+import threading
+from bisect import bisect_left
 from collections import deque
-from datetime import datetime, timedelta, timezone
+from datetime import date, datetime, timedelta, timezone
+from itertools import islice
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Deque, Dict, List, Optional
+from typing import Any, BinaryIO, Deque, Dict, List, Optional, Tuple
 
+import orjson
 from pydantic import BaseModel, ConfigDict, model_validator
 
+from .ups_time import parse_iso, utc_now_iso
 
-def _utc_now_iso() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+_EPOCH_KEY = itemgetter(0)
 
 
 def _parse_ts(ts: str) -> Optional[datetime]:
     try:
-        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+        return parse_iso(ts)
     except Exception:
         return None
 
 
+def _ts_epoch(ts: Any) -> Optional[float]:
+    """
+    Parse a stored ts string to a UTC epoch; naive timestamps are taken as UTC.
+    """
+    if not isinstance(ts, str):
+        return None
+    dt = _parse_ts(ts)
+    if dt is None:
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.timestamp()
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
 class UPSLogRowModel(BaseModel):
     model_config = ConfigDict(extra="allow")
 
@@ -39,7 +66,7 @@ class UPSLogRowModel(BaseModel):
             ts = row.get("timestamp") or row.get("time") or row.get("datetime")
 
         if isinstance(ts, datetime):
-            ts = ts.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+            ts = ts.astimezone(timezone.utc).isoformat().removesuffix("+00:00") + "Z"
 
         if not isinstance(ts, str) or not ts.strip():
             raise ValueError("UPS log row is missing timestamp.")
@@ -55,6 +82,14 @@ class UPSLogRowModel(BaseModel):
         return row
 
 
+def _dump_row(row: Dict[str, Any]) -> bytes:
+    try:
+        return orjson.dumps(row)
+    except TypeError:
+        # e.g. ints beyond 64 bits; stdlib json handles those.
+        return json.dumps(row, ensure_ascii=False).encode("utf-8")
+
+
 def _normalize_row(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     try:
         model = UPSLogRowModel.model_validate(row)
@@ -63,6 +98,26 @@ def _normalize_row(row: Dict[str, Any]) -> Optional[Dict[str, Any]]:
     return model.model_dump(mode="json")
 
 
+def _parse_line(line: bytes) -> Optional[Tuple[float, Dict[str, Any]]]:
+    line = line.strip()
+    if not line:
+        return None
+
+    try:
+        row = orjson.loads(line)
+    except Exception:
+        return None
+
+    norm = _normalize_row(row)
+    if not norm:
+        return None
+
+    epoch = _ts_epoch(norm["ts"])
+    if epoch is None:
+        return None
+    return epoch, norm
+
+
 class UPSLogStore:
     def __init__(
         self,
@@ -70,39 +125,177 @@ class UPSLogStore:
         log_file: str,
         timezone_name: str = "UTC",
         history_limit: int = 5000,
+        flush_interval_seconds: float = 5.0,
     ) -> None:
         self.log_path = Path(log_file).expanduser().resolve()
         self.timezone_name = timezone_name
-        self.history: Deque[Dict[str, Any]] = deque(maxlen=history_limit)
+        # (epoch seconds, row): the timestamp is parsed once on the way in so
+        # window queries are plain float compares. Rows arrive in time order,
+        # so get_recent() can bisect for the window start.
+        self.history: Deque[Tuple[float, Dict[str, Any]]] = deque(maxlen=history_limit)
+        # Polls append from a worker thread while graph commands read.
+        self._history_lock = threading.Lock()
+
+        # Append handle kept open between polls; reopened if log_path changes.
+        # _fh_day is the UTC day of the rows last written to the file, used to
+        # rotate the previous day's rows into a .gz archive.
+        self._fh: Optional[BinaryIO] = None
+        self._fh_path: Optional[Path] = None
+        self._fh_day: Optional[date] = None
+
+        # Serialized rows waiting for the next batched write. The first row
+        # of a batch arms a daemon timer that writes it flush_interval_seconds
+        # later, however long until the next append; append() also writes
+        # first when the UTC day changes so a batch never spans two days, and
+        # flush()/close() write whatever is pending. _pending_day is the UTC
+        # day the pending rows were appended on.
+        self.flush_interval_seconds = flush_interval_seconds
+        self._pending: List[bytes] = []
+        self._pending_day: Optional[date] = None
+        self._flush_timer: Optional[threading.Timer] = None
+        self._write_lock = threading.Lock()
+
+    def _archive_path(self, day: date) -> Path:
+        # ups_stats.jsonl -> ups_stats-2024-01-31.jsonl.gz
+        p = self.log_path
+        return p.with_name(f"{p.stem}-{day.isoformat()}{p.suffix}.gz")
+
+    def _ensure_open(self) -> BinaryIO:
+        if self._fh is not None and self._fh_path == self.log_path:
+            return self._fh
+
+        self._close_handle()
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._fh = self.log_path.open("ab", buffering=0)
+        self._fh_path = self.log_path
+
+        st = self.log_path.stat()
+        self._fh_day = (
+            datetime.fromtimestamp(st.st_mtime, timezone.utc).date()
+            if st.st_size
+            else None
+        )
+        return self._fh
+
+    def _rotate(self, day: date) -> None:
+        """
+        Compress the current log into the archive for ``day`` and start a
+        fresh file. On failure the current file is kept and writing continues.
+        """
+        self._close_handle()
+        archive = self._archive_path(day)
+        try:
+            # "ab" adds a gzip member if the archive already exists.
+            with self.log_path.open("rb") as src, gzip.open(archive, "ab") as dst:
+                shutil.copyfileobj(src, dst)
+            self.log_path.unlink()
+            logging.info("Rotated UPS log to %s", archive)
+        except Exception:
+            logging.exception("Failed rotating UPS log %s to %s", self.log_path, archive)
+
+    def close(self) -> None:
+        """
+        Write any pending rows and release the file handle.
+        """
+        self.flush()
+        with self._write_lock:
+            self._close_handle()
+
+    def _close_handle(self) -> None:
+        if self._fh is None:
+            return
+        try:
+            self._fh.close()
+        except Exception:
+            logging.exception("Failed closing UPS log file %s", self._fh_path)
+        finally:
+            self._fh = None
+            self._fh_path = None
+            self._fh_day = None
 
     def append(self, row: Dict[str, Any]) -> None:
         """
         Append a row to in-memory history and write JSONL.
-        Ensures 'ts' exists for graphing.
+        Ensures 'ts' exists for graphing. Well-formed rows are kept by
+        reference, so callers must not modify them afterwards.
         """
         if not isinstance(row, dict):
             return
 
         # Ensure timestamp exists
         if not row.get("ts") and not row.get("timestamp") and not row.get("time"):
-            row["ts"] = _utc_now_iso()
+            row["ts"] = utc_now_iso()
 
-        norm = _normalize_row(dict(row))
-        if not norm:
+        # Rows built by UPSService already have a clean string ts and no
+        # legacy keys, and their values are JSON-native: store them as given
+        # (keeping their column order). Anything else goes through the model.
+        ts = row.get("ts")
+        if isinstance(ts, str) and ts and ts == ts.strip() and "time_to_empty" not in row:
+            norm = row
+        else:
+            norm = _normalize_row(row)
+            if not norm:
+                return
+
+        epoch = _ts_epoch(norm["ts"])
+        if epoch is not None:
+            with self._history_lock:
+                self.history.append((epoch, norm))
+
+        with self._write_lock:
+            today = _utc_today()
+            if self._pending and self._pending_day != today:
+                # Write the previous day's rows before starting today's batch.
+                self._flush_locked()
+            self._pending.append(_dump_row(norm) + b"\n")
+            self._pending_day = today
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval_seconds, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def flush(self) -> None:
+        """
+        Write all pending rows to the JSONL file in one call.
+        """
+        with self._write_lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        # Caller holds self._write_lock.
+        if self._flush_timer is not None:
+            # No-op when called from the timer itself.
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
             return
-
-        self.history.append(norm)
+        payload = b"".join(self._pending)
+        count = len(self._pending)
+        day = self._pending_day or _utc_today()
+        self._pending.clear()
+        self._pending_day = None
 
         try:
-            self.log_path.parent.mkdir(parents=True, exist_ok=True)
-            with self.log_path.open("a", encoding="utf-8") as f:
-                f.write(json.dumps(norm, ensure_ascii=False) + "\n")
+            fh = self._ensure_open()
+            if self._fh_day is not None and self._fh_day < day:
+                self._rotate(self._fh_day)
+                fh = self._ensure_open()
+            fh.write(payload)
+            self._fh_day = day
         except Exception:
-            logging.exception("Failed writing UPS log row to %s", self.log_path)
+            # Drop the handle so the next flush retries a fresh open.
+            self._close_handle()
+            logging.exception(
+                "Failed writing %s UPS log row(s) to %s", count, self.log_path
+            )
 
     def preload_recent(self, hours: int = 24) -> None:
         """
         Load the last N hours from the JSONL file into memory.
+
+        The log is append-ordered, so it is read from the end and the scan
+        stops at the first row older than the window. Rotated ``.gz``
+        archives are only read when the window reaches past the current file.
         """
         if not self.log_path.exists():
             logging.warning("UPS log file not found for preload: %s", self.log_path)
@@ -110,52 +303,90 @@ class UPSLogStore:
 
         logging.info("Preloading UPS log from: %s", self.log_path)
 
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).timestamp()
 
-        loaded = 0
+        rows: List[Tuple[float, Dict[str, Any]]] = []
         try:
-            with self.log_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line = line.strip()
-                    if not line:
-                        continue
-
-                    try:
-                        row = json.loads(line)
-                    except Exception:
-                        continue
-
-                    norm = _normalize_row(row)
-                    if not norm:
-                        continue
-
-                    dt = _parse_ts(norm["ts"])
-                    if not dt:
-                        continue
-
-                    if dt >= cutoff:
-                        self.history.append(norm)
-                        loaded += 1
+            try:
+                rows, complete = self._scan_backwards(cutoff)
+            except (OSError, ValueError):
+                # mmap refuses empty files and some filesystems.
+                rows, complete = self._scan_forward(cutoff), False
+
+            if not complete:
+                rows = self._scan_archives(cutoff) + rows
         except Exception:
             logging.exception("Failed preloading UPS log from %s", self.log_path)
 
-        logging.info("UPS preload complete. Rows loaded: %s", loaded)
+        with self._history_lock:
+            self.history.extend(rows)
+
+        logging.info("UPS preload complete. Rows loaded: %s", len(rows))
+
+    def _scan_backwards(
+        self, cutoff: float
+    ) -> Tuple[List[Tuple[float, Dict[str, Any]]], bool]:
+        """
+        Returns (rows in time order, whether the scan stopped before the
+        start of the file because it reached the cutoff or history limit).
+        """
+        rows: List[Tuple[float, Dict[str, Any]]] = []
+        limit = self.history.maxlen
+        complete = False
+
+        with self.log_path.open("rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm:
+            end = len(mm)
+            while end > 0:
+                start = mm.rfind(b"\n", 0, end) + 1
+                parsed = _parse_line(mm[start:end])
+                end = start - 1
+                if parsed is None:
+                    continue
+                if parsed[0] < cutoff:
+                    complete = True
+                    break
+                rows.append(parsed)
+                if limit is not None and len(rows) >= limit:
+                    complete = True
+                    break
+
+        rows.reverse()
+        return rows, complete
+
+    def _scan_forward(
+        self, cutoff: float, path: Optional[Path] = None
+    ) -> List[Tuple[float, Dict[str, Any]]]:
+        path = path or self.log_path
+        rows: List[Tuple[float, Dict[str, Any]]] = []
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rb") as f:
+            for line in f:
+                parsed = _parse_line(line)
+                if parsed is not None and parsed[0] >= cutoff:
+                    rows.append(parsed)
+        return rows
+
+    def _scan_archives(self, cutoff: float) -> List[Tuple[float, Dict[str, Any]]]:
+        """
+        Rows within the window from rotated archives, oldest day first.
+        """
+        rows: List[Tuple[float, Dict[str, Any]]] = []
+        day = datetime.fromtimestamp(cutoff, timezone.utc).date()
+        today = datetime.now(timezone.utc).date()
+        while day <= today:
+            archive = self._archive_path(day)
+            if archive.exists():
+                rows.extend(self._scan_forward(cutoff, archive))
+            day += timedelta(days=1)
+        return rows
 
     def get_recent(self, *, hours: int) -> List[Dict[str, Any]]:
         """
         Return rows from memory within the last N hours.
         """
-        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
-        out: List[Dict[str, Any]] = []
-
-        for row in list(self.history):
-            ts = row.get("ts")
-            if not isinstance(ts, str):
-                continue
-            dt = _parse_ts(ts)
-            if not dt:
-                continue
-            if dt >= cutoff:
-                out.append(row)
-
-        return out
+        cutoff = (datetime.now(timezone.utc) - timedelta(hours=hours)).timestamp()
+        with self._history_lock:
+            start = bisect_left(self.history, cutoff, key=_EPOCH_KEY)
+            return [row for _, row in islice(self.history, start, None)]
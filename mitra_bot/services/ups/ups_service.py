@@ -2,18 +2,17 @@
 from __future__ import annotations
 
 import logging
+import time
 from dataclasses import dataclass
-from datetime import datetime, timezone
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
-
 from .tripplite_client import TrippliteUPSClient
 from .ups_log import UPSLogStore
+from .ups_time import utc_now_iso
 from mitra_bot.services.power_service import execute_power_action
 
 
-@dataclass
+@dataclass(slots=True)
 class UPSConfig:
     enabled: bool
     warn_time_to_empty_seconds: int
@@ -24,7 +23,7 @@ class UPSConfig:
     auto_shutdown_force: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class UPSEvent:
     """
     Structured event returned by poll().
@@ -35,17 +34,23 @@ class UPSEvent:
     message: str
 
 
-def _utc_ts_z() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+# Preformatted "<n>s" strings for runtimes under a minute.
+_SHORT_SEC = tuple(f"{i}s" for i in range(60))
 
 
 def _fmt_seconds(seconds: Optional[float]) -> str:
     if seconds is None:
         return "unknown"
-    try:
-        s = max(0, int(seconds))
-    except Exception:
-        return "unknown"
+    if isinstance(seconds, int):
+        s = max(0, seconds)
+    else:
+        try:
+            s = max(0, int(seconds))
+        except Exception:
+            return "unknown"
+
+    if s < 60:
+        return _SHORT_SEC[s]
 
     m, s = divmod(s, 60)
     h, m = divmod(m, 60)
@@ -56,45 +61,108 @@ def _fmt_seconds(seconds: Optional[float]) -> str:
     return f"{s}s"
 
 
-class UPSStatusFlagsModel(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-
-    ac_present: Optional[bool] = Field(default=None, alias="ac present")
-    charging: Optional[bool] = None
-    discharging: Optional[bool] = None
-    shutdown_imminent: Optional[bool] = Field(default=None, alias="shutdown imminent")
-    needs_replacement: Optional[bool] = Field(default=None, alias="needs replacement")
-
-
-class UPSInputModel(BaseModel):
-    model_config = ConfigDict(extra="ignore")
-
-    voltage: Optional[float] = None
-    frequency: Optional[float] = None
+_TRUE_STRINGS = frozenset({"1", "true", "t", "yes", "y", "on"})
+_FALSE_STRINGS = frozenset({"0", "false", "f", "no", "n", "off"})
 
 
-class UPSOutputModel(BaseModel):
-    model_config = ConfigDict(extra="ignore")
+def _safe_bool(v: Any) -> Optional[bool]:
+    if v is None or isinstance(v, bool):
+        return v
+    if isinstance(v, (int, float)):
+        return bool(v) if v in (0, 1) else None
+    if isinstance(v, str):
+        s = v.strip().lower()
+        if s in _TRUE_STRINGS:
+            return True
+        if s in _FALSE_STRINGS:
+            return False
+    return None
 
-    voltage: Optional[float] = None
-    power: Optional[float] = None
 
-
-class UPSStatusModel(BaseModel):
-    model_config = ConfigDict(extra="ignore", populate_by_name=True)
-
-    status: UPSStatusFlagsModel = Field(default_factory=UPSStatusFlagsModel)
-    input: UPSInputModel = Field(default_factory=UPSInputModel)
-    output: UPSOutputModel = Field(default_factory=UPSOutputModel)
-    health: Optional[float] = None
-    time_to_empty: Optional[float] = Field(default=None, alias="time to empty")
-    battery_percent: Optional[float] = None
-    input_voltage: Optional[float] = None
-    time_to_empty_seconds: Optional[float] = None
-    on_battery: Optional[bool] = None
+def _safe_float(v: Any) -> Optional[float]:
+    if v is None:
+        return None
+    if isinstance(v, (int, float)):
+        return float(v)
+    if isinstance(v, str):
+        try:
+            return float(v.strip())
+        except ValueError:
+            return None
+    return None
+
+
+def _get_dict(d: Dict[str, Any], key: str) -> Dict[str, Any]:
+    v = d.get(key)
+    return v if isinstance(v, dict) else {}
+
+
+# Status flags as reported by tripplite ("status" sub-dict) -> log row key.
+# The log row key is also accepted as the input name.
+_STATUS_KEYS = (
+    ("ac present", "ac_present"),
+    ("charging", "charging"),
+    ("discharging", "discharging"),
+    ("shutdown imminent", "shutdown_imminent"),
+    ("needs replacement", "needs_replacement"),
+)
+
+# A row is logged at least this often even when nothing changed. Logged rows
+# reach disk within the log store's own flush interval, so the worst-case lag
+# for a steady reading is this plus that interval.
+LOG_HEARTBEAT_SECONDS = 300.0
+
+# Numeric log fields and how far each must move (since the last logged row)
+# to be logged before the heartbeat; any flag or power-source change is
+# always logged.
+_LOG_TOLERANCES = (
+    ("time_to_empty_s", 30.0),
+    ("battery_percent", 1.0),
+    ("health_pct", 1.0),
+    ("input_v", 1.0),
+    ("input_hz", 0.2),
+    ("output_v", 1.0),
+    ("output_w", 5.0),
+)
+_LOG_FLAG_KEYS = tuple(key for _, key in _STATUS_KEYS) + ("on_battery",)
+
+
+def _log_row_changed(prev: Dict[str, Any], row: Dict[str, Any]) -> bool:
+    for key in _LOG_FLAG_KEYS:
+        if row[key] != prev[key]:
+            return True
+    for key, tolerance in _LOG_TOLERANCES:
+        new, old = row[key], prev[key]
+        if new is None or old is None:
+            if new is not old:
+                return True
+        elif abs(new - old) > tolerance:
+            return True
+    return False
+
+
+# Alert rank -> (event level, message prefix) for the runtime thresholds.
+_THRESHOLD_EVENTS = {
+    1: ("warn", "⚠️ UPS battery running low."),
+    2: ("critical", "🚨 UPS battery critical."),
+}
 
 
 class UPSService:
+    __slots__ = (
+        "client",
+        "log_store",
+        "_config",
+        "_enabled",
+        "_warn_s",
+        "_crit_s",
+        "_last_state",
+        "_alert_rank",
+        "_shutdown_issued",
+        "_last_logged",
+        "_last_logged_at",
+    )
+
     def __init__(
         self,
         *,
@@ -107,6 +175,28 @@ class UPSService:
         self.config = config
 
         self._last_state: Optional[str] = None  # "line" | "battery"
+        # Highest threshold alerted in the current battery session
+        # (0 none, 1 warn, 2 critical); only escalations emit events.
+        self._alert_rank = 0
+        # Whether auto shutdown went through in the current battery session;
+        # until it does, every critical poll tries again.
+        self._shutdown_issued = False
+        # Last row handed to the log store and its time.monotonic().
+        self._last_logged: Optional[Dict[str, Any]] = None
+        self._last_logged_at = 0.0
+
+    @property
+    def config(self) -> UPSConfig:
+        return self._config
+
+    @config.setter
+    def config(self, config: UPSConfig) -> None:
+        # Fields read on every poll are resolved once per config (the cog
+        # swaps in a new UPSConfig on reload).
+        self._config = config
+        self._enabled = bool(config.enabled)
+        self._warn_s = int(config.warn_time_to_empty_seconds)
+        self._crit_s = int(config.critical_time_to_empty_seconds)
 
     # --------------------------------------------------
     # Public poll method
@@ -117,7 +207,7 @@ class UPSService:
         Poll the UPS and return an optional UPSEvent
         if something important happened.
         """
-        if not self.config.enabled:
+        if not self._enabled:
             return None
 
         if not self.client.available:
@@ -130,7 +220,11 @@ class UPSService:
             logging.exception("Failed to poll UPS.")
             return None
 
-        return self._process_status(status)
+        event = self._process_status(status)
+        if event is not None:
+            # Rows behind an alert go to disk now, not at the next batch write.
+            self.log_store.flush()
+        return event
 
     # --------------------------------------------------
     # Internal logic
@@ -149,37 +243,40 @@ class UPSService:
         # Support both:
         # - "legacy/raw" tripplite dict with nested status/input/output and "time to empty"
         # - "refactor" minimal dict with battery_percent/input_voltage/time_to_empty_seconds/on_battery
-        parsed = UPSStatusModel.model_validate(status)
-
-        ac_present = parsed.status.ac_present
-        charging = parsed.status.charging
-        discharging = parsed.status.discharging
-        shutdown_imminent = parsed.status.shutdown_imminent
-        needs_replacement = parsed.status.needs_replacement
-
-        health_pct = parsed.health
-        time_to_empty_s = parsed.time_to_empty
-
-        input_v = parsed.input.voltage
-        input_hz = parsed.input.frequency
-        output_v = parsed.output.voltage
-        output_w = parsed.output.power
-
-        battery_percent = parsed.battery_percent
+        # This runs on every poll, so fields are pulled with plain dict lookups
+        # through local aliases instead of a validation model.
+        sb = _safe_bool
+        sf = _safe_float
+        gs = status.get
+        g_in = _get_dict(status, "input").get
+        g_out = _get_dict(status, "output").get
+
+        flags = _get_dict(status, "status")
+        flag_values: Dict[str, Optional[bool]] = {}
+        for raw_key, key in _STATUS_KEYS:
+            value = sb(flags.get(raw_key))
+            if value is None:
+                value = sb(flags.get(key))
+            flag_values[key] = value
+        ac_present = flag_values["ac_present"]
+
+        time_to_empty_s = sf(gs("time to empty"))
+        if time_to_empty_s is None:
+            time_to_empty_s = sf(gs("time_to_empty"))
+        if time_to_empty_s is None:
+            time_to_empty_s = sf(gs("time_to_empty_seconds"))
 
+        input_v = sf(g_in("voltage"))
         if input_v is None:
-            input_v = parsed.input_voltage
-
-        if time_to_empty_s is None:
-            time_to_empty_s = parsed.time_to_empty_seconds
+            input_v = sf(gs("input_voltage"))
 
         # Determine on_battery:
         # 1) if provided explicitly, use it
         # 2) else derive from ac_present if we have it
         # 3) else default False
-        on_battery_val = parsed.on_battery
+        on_battery_val = sb(gs("on_battery"))
         if on_battery_val is not None:
-            on_battery = bool(on_battery_val)
+            on_battery = on_battery_val
         elif ac_present is not None:
             on_battery = ac_present is False
         else:
@@ -191,27 +288,34 @@ class UPSService:
         # LOG ROW: match old bot.py keys (plus compatibility keys)
         # ------------------------------------------------------------------
         log_row: Dict[str, Any] = {
-            "ts": _utc_ts_z(),
+            "ts": utc_now_iso(),
             # original keys used by old graphs
-            "ac_present": ac_present,
-            "charging": charging,
-            "discharging": discharging,
-            "shutdown_imminent": shutdown_imminent,
-            "needs_replacement": needs_replacement,
-            "health_pct": health_pct,
+            **flag_values,
+            "health_pct": sf(gs("health")),
             "time_to_empty_s": time_to_empty_s,
             "input_v": input_v,
-            "input_hz": input_hz,
-            "output_v": output_v,
-            "output_w": output_w,
+            "input_hz": sf(g_in("frequency")),
+            "output_v": sf(g_out("voltage")),
+            "output_w": sf(g_out("power")),
             # newer keys (so other parts of refactor can use them)
-            "battery_percent": battery_percent,
+            "battery_percent": sf(gs("battery_percent")),
             "input_voltage": input_v,
             "time_to_empty_seconds": time_to_empty_s,
             "on_battery": on_battery,
         }
 
-        self.log_store.append(log_row)
+        # Calm polls (same flags, readings within tolerance) are only logged
+        # once per heartbeat; the graph draws straight through the gap.
+        now = time.monotonic()
+        last = self._last_logged
+        if (
+            last is None
+            or now - self._last_logged_at >= LOG_HEARTBEAT_SECONDS
+            or _log_row_changed(last, log_row)
+        ):
+            self.log_store.append(log_row)
+            self._last_logged = log_row
+            self._last_logged_at = now
 
         # ------------------------------------------------------------------
         # Events: state transition detection
@@ -222,6 +326,8 @@ class UPSService:
 
         if current_state != self._last_state:
             self._last_state = current_state
+            self._alert_rank = 0
+            self._shutdown_issued = False
 
             if current_state == "battery":
                 return UPSEvent(
@@ -249,41 +355,59 @@ class UPSService:
     def _check_thresholds(self, time_to_empty_seconds: int) -> Optional[UPSEvent]:
         """
         Evaluate warning / critical thresholds.
+
+        Each level is reported once per battery session (again only if
+        runtime recovers above it and drops back), not on every poll. Auto
+        shutdown is retried on every critical poll until it succeeds.
         """
+        if time_to_empty_seconds <= self._crit_s:
+            rank = 2
+        elif time_to_empty_seconds <= self._warn_s:
+            rank = 1
+        else:
+            rank = 0
 
-        if time_to_empty_seconds <= self.config.critical_time_to_empty_seconds:
-            self._handle_auto_shutdown()
-            return UPSEvent(
-                level="critical",
-                message=f"🚨 UPS battery critical. Runtime: **{_fmt_seconds(time_to_empty_seconds)}**",
-            )
+        if rank == 2 and not self._shutdown_issued:
+            self._shutdown_issued = self._handle_auto_shutdown()
 
-        if time_to_empty_seconds <= self.config.warn_time_to_empty_seconds:
-            return UPSEvent(
-                level="warn",
-                message=f"⚠️ UPS battery running low. Runtime: **{_fmt_seconds(time_to_empty_seconds)}**",
-            )
+        previous = self._alert_rank
+        self._alert_rank = rank
+        if rank <= previous:
+            return None
 
-        return None
+        level, text = _THRESHOLD_EVENTS[rank]
+        return UPSEvent(
+            level=level,
+            message=f"{text} Runtime: **{_fmt_seconds(time_to_empty_seconds)}**",
+        )
 
     # --------------------------------------------------
     # Auto shutdown
     # --------------------------------------------------
 
-    def _handle_auto_shutdown(self) -> None:
-        if not self.config.auto_shutdown_enabled:
-            return
+    def _handle_auto_shutdown(self) -> bool:
+        """
+        Run the configured auto shutdown action; True if it was issued.
+        """
+        config = self._config
+        if not config.auto_shutdown_enabled:
+            return False
 
         try:
             logging.warning(
                 "Auto shutdown triggered: %s",
-                self.config.auto_shutdown_action,
+                config.auto_shutdown_action,
             )
 
+            # The OS shutdown may not run the log's atexit close; write the
+            # critical rows that triggered it first.
+            self.log_store.flush()
             execute_power_action(
-                self.config.auto_shutdown_action,
-                delay_seconds=self.config.auto_shutdown_delay_seconds,
-                force=self.config.auto_shutdown_force,
+                config.auto_shutdown_action,
+                delay_seconds=config.auto_shutdown_delay_seconds,
+                force=config.auto_shutdown_force,
             )
         except Exception:
             logging.exception("Auto shutdown failed.")
+            return False
+        return True
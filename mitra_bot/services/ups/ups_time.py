@@ -0,0 +1,43 @@
+# mitra_bot/services/ups/ups_time.py
+from __future__ import annotations
+
+import sys
+import time
+from datetime import datetime
+from typing import Tuple
+
+# 3.11+ fromisoformat accepts a trailing "Z" itself, so the per-row
+# "Z" -> "+00:00" rewrite is only needed on older interpreters.
+_PY311 = sys.version_info >= (3, 11)
+_FROMISO = datetime.fromisoformat
+
+
+def parse_iso(ts: str) -> datetime:
+    """
+    Parse a stored ISO-8601 timestamp (``...Z`` or explicit offset).
+    Raises ValueError on malformed input.
+    """
+    if _PY311:
+        return _FROMISO(ts)
+    return _FROMISO(ts.replace("Z", "+00:00"))
+
+
+# (epoch second, "YYYY-MM-DDTHH:MM:SS") of the last formatted timestamp.
+_TS_PREFIX: Tuple[int, str] = (-1, "")
+
+
+def utc_now_iso() -> str:
+    """
+    Current UTC time as ``YYYY-MM-DDTHH:MM:SS.ffffffZ`` (the stored ts format).
+
+    Formats from time.time() without building a datetime; the seconds
+    prefix is reused for calls within the same second.
+    """
+    global _TS_PREFIX
+    t = time.time()
+    sec = int(t)
+    cached_sec, prefix = _TS_PREFIX
+    if sec != cached_sec:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(sec))
+        _TS_PREFIX = (sec, prefix)
+    return f"{prefix}.{int((t - sec) * 1_000_000):06d}Z"
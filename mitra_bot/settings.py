@@ -2,11 +2,15 @@
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import Optional
 
 from mitra_bot.models.settings_models import AppSettingsModel
-from mitra_bot.storage.cache_store import read_cache_with_defaults, write_cache_json
+from mitra_bot.storage.cache_store import (
+    cache_batch,
+    read_cache_with_defaults,
+    write_cache_json,
+)
 
 
 @dataclass(frozen=True)
@@ -29,6 +33,10 @@ class UPSSettings:
     timezone: str = "UTC"
 
 
+# UPSSettings mirrors UPSSettingsModel field-for-field.
+_UPS_FIELDS = tuple(f.name for f in fields(UPSSettings))
+
+
 @dataclass(frozen=True)
 class AppSettings:
     token: str
@@ -39,41 +47,34 @@ class AppSettings:
     admin_role_name: str
     ip_subscriber_role_name: str
 
+    # Fall back to a REST channel fetch when the restart notice channel is
+    # not cached at ready time.
+    strict_restart_notice: bool = False
+
 
 def load_settings(*, interactive_token: bool = True) -> AppSettings:
     """
     Load settings from cache.json + env overrides.
     Optionally prompt for token if missing.
     """
-    cfg = read_cache_with_defaults()
+    # The defaults write-back and a newly entered token land in one write.
+    with cache_batch():
+        cfg = read_cache_with_defaults()
 
-    env_token = os.getenv("MITRA_TOKEN") or os.getenv("DISCORD_TOKEN")
-    token = (env_token or cfg.get("token") or "").strip()
+        env_token = os.getenv("MITRA_TOKEN") or os.getenv("DISCORD_TOKEN")
+        token = (env_token or cfg.get("token") or "").strip()
 
-    if not token and interactive_token:
-        token = input("Please enter your Discord bot token: ").strip()
-        cfg["token"] = token
-        write_cache_json(cfg)
+        if not token and interactive_token:
+            token = input("Please enter your Discord bot token: ").strip()
+            cfg["token"] = token
+            write_cache_json(cfg)
 
     if not token:
         raise RuntimeError("Discord token is missing (cache.json or env var).")
 
     parsed = AppSettingsModel.model_validate(cfg)
 
-    ups = UPSSettings(
-        enabled=parsed.ups.enabled,
-        poll_seconds=parsed.ups.poll_seconds,
-        warn_time_to_empty_seconds=parsed.ups.warn_time_to_empty_seconds,
-        critical_time_to_empty_seconds=parsed.ups.critical_time_to_empty_seconds,
-        auto_shutdown_enabled=parsed.ups.auto_shutdown_enabled,
-        auto_shutdown_action=parsed.ups.auto_shutdown_action,
-        auto_shutdown_delay_seconds=parsed.ups.auto_shutdown_delay_seconds,
-        auto_shutdown_force=parsed.ups.auto_shutdown_force,
-        log_enabled=parsed.ups.log_enabled,
-        log_file=parsed.ups.log_file,
-        graph_default_hours=parsed.ups.graph_default_hours,
-        timezone=parsed.ups.timezone,
-    )
+    ups = UPSSettings(**{name: getattr(parsed.ups, name) for name in _UPS_FIELDS})
 
     return AppSettings(
         token=token,
@@ -82,4 +83,5 @@ def load_settings(*, interactive_token: bool = True) -> AppSettings:
         ups=ups,
         admin_role_name=parsed.admin_role_name,
         ip_subscriber_role_name=parsed.ip_subscriber_role_name,
+        strict_restart_notice=parsed.strict_restart_notice,
     )
@@ -1,30 +1,213 @@
 from __future__ import annotations
 
+import copy
 import json
+import logging
+import mmap
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
+
+import orjson
+
+
+def _canonical(data: Dict[str, Any]) -> bytes:
+    try:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        return json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _dump(data: Dict[str, Any]) -> bytes:
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
+    except TypeError:
+        # e.g. ints beyond 64 bits; stdlib json handles those.
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
 
 
 class CacheRepository:
     def __init__(self, path: Path, normalizer: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
         self.path = path
         self.normalizer = normalizer
+        # ((st_mtime_ns, st_size), normalized) for the file as last read;
+        # the file rarely changes, so reads are a stat() in the steady state.
+        self._cache: Optional[Tuple[Tuple[int, int], Dict[str, Any]]] = None
+        # (stat key, bytes) of our last write, so an unchanged payload can be
+        # recognised without re-reading the file.
+        self._last_written: Optional[Tuple[Optional[Tuple[int, int]], bytes]] = None
+        # Serialized payload written inside batch() and not yet flushed.
+        self._pending: Optional[bytes] = None
+        self._batch_depth = 0
+        # Not reentrant: public methods take it once and share *_locked helpers.
+        self._lock = threading.Lock()
+
+    def _stat_key(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = self.path.stat()
+        except OSError:
+            return None
+        return st.st_mtime_ns, st.st_size
 
     def read_raw(self) -> Dict[str, Any]:
+        pending = self._pending
+        if pending is not None:
+            return orjson.loads(pending)
         try:
-            return json.loads(self.path.read_text(encoding="utf-8"))
-        except (FileNotFoundError, json.JSONDecodeError):
+            with open(self.path, "rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return {}
+                # Parse straight from the page cache instead of copying the
+                # file into a bytes object first.
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except (OSError, ValueError):
+                    return orjson.loads(f.read())
+                with mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+        except (FileNotFoundError, orjson.JSONDecodeError):
             return {}
 
-    def read_normalized(self) -> Dict[str, Any]:
-        return self.normalizer(self.read_raw())
+    def read_normalized(self, *, copy_result: bool = False, persist: bool = False) -> Dict[str, Any]:
+        """
+        Normalized file contents, re-read only when the file's mtime/size changed.
+
+        The returned dict is shared with the cache; pass ``copy_result=True``
+        if the caller will mutate it. With ``persist=True`` a file that
+        normalization changed is written back.
+        """
+        with self._lock:
+            if self._pending is not None:
+                # Already normalized by write(); decoding gives a fresh copy.
+                return orjson.loads(self._pending)
+            normalized = self._read_normalized_locked(persist)
+
+        return copy.deepcopy(normalized) if copy_result else normalized
+
+    def _read_normalized_locked(self, persist: bool) -> Dict[str, Any]:
+        # Caller holds self._lock and has checked self._pending.
+        key = self._stat_key()
+        cached = self._cache
+        if key is not None and cached is not None and cached[0] == key:
+            return cached[1]
+
+        raw = self.read_raw()
+        before = _canonical(raw) if persist else b""
+        normalized = self.normalizer(raw)
+        if persist and _canonical(normalized) != before:
+            if self._batch_depth:
+                self._pending = _dump(normalized)
+            else:
+                try:
+                    self._write_file(_dump(normalized))
+                except Exception:
+                    logging.exception("Failed to write normalized cache to %s", self.path)
+                key = self._stat_key()
+        self._cache = (key, normalized) if key is not None else None
+        return normalized
+
+    def _write_file(self, payload: bytes) -> bool:
+        """
+        Write the payload unless the file already holds exactly these bytes.
+        Returns True if the file was written.
+        """
+        key = self._stat_key()
+        if key is not None:
+            if self._last_written == (key, payload):
+                return False
+            try:
+                if self.path.read_bytes() == payload:
+                    self._last_written = (key, payload)
+                    return False
+            except OSError:
+                pass
+
+        self.path.write_bytes(payload)
+        self._last_written = (self._stat_key(), payload)
+        return True
 
     def write(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            if self._is_current_locked(data):
+                return data
         normalized = self.normalizer(data)
-        self.path.write_text(json.dumps(normalized), encoding="utf-8")
+        payload = _dump(normalized)
+        with self._lock:
+            self._write_locked(payload)
         return normalized
 
+    def _is_current_locked(self, data: Dict[str, Any]) -> bool:
+        # Caller holds self._lock. True if the file holds our own last write
+        # and data equals its cached normalized view: the normalizer is
+        # idempotent, so there is nothing to validate or write.
+        if self._pending is not None:
+            return False
+        cached = self._cache
+        last = self._last_written
+        if cached is None or last is None or cached[0] != last[0]:
+            return False
+        return cached[0] == self._stat_key() and data == cached[1]
+
+    def _write_locked(self, payload: bytes) -> None:
+        # Caller holds self._lock.
+        if self._batch_depth:
+            self._pending = payload
+        else:
+            self._store(payload)
+
+    def _store(self, payload: bytes) -> None:
+        # Caller holds self._lock.
+        try:
+            self._write_file(payload)
+        except Exception:
+            self._cache = None
+            raise
+        # The file now holds exactly the normalized payload, so seed the read
+        # cache instead of re-reading and re-normalizing it. Decoding the
+        # payload gives the cache its own copy.
+        key = self._stat_key()
+        self._cache = (key, orjson.loads(payload)) if key is not None else None
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Coalesce writes: inside the block write()/mutate() only update the
+        in-memory copy, which reads see; the file is written once when the
+        outermost block exits.
+        """
+        with self._lock:
+            self._batch_depth += 1
+        try:
+            yield
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                outermost = self._batch_depth == 0
+            if outermost:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Write data held back by batch() now.
+        """
+        with self._lock:
+            pending = self._pending
+            if pending is None:
+                return
+            self._pending = None
+            self._store(pending)
+
     def mutate(self, fn: Callable[[Dict[str, Any]], None], *, normalize_read: bool = False) -> Dict[str, Any]:
-        data = self.read_normalized() if normalize_read else self.read_raw()
-        fn(data)
-        return self.write(data)
+        with self._lock:
+            if not normalize_read or self._pending is not None:
+                data = self.read_raw()
+            else:
+                data = copy.deepcopy(self._read_normalized_locked(False))
+            fn(data)
+            if self._is_current_locked(data):
+                return data
+            normalized = self.normalizer(data)
+            self._write_locked(_dump(normalized))
+            return normalized
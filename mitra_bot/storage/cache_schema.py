@@ -1,21 +1,72 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from dataclasses import dataclass
+from typing import Any, Callable, ClassVar, Dict, Mapping, Optional, Tuple
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    field_validator,
+    model_validator,
+    with_config,
+)
+from typing_extensions import Annotated, TypedDict
+
+from mitra_bot.utils.snowflake import to_int, to_int_optional
+
+
+# Pre-migration keys; data without any of them is already in the current shape.
+_LEGACY_TODO_KEYS = ("categories", "hubs", "hub_messages", "board_messages", "tasks")
+_LEGACY_CLOUDFLARE_KEYS = ("api_token", "api_key", "email", "zone_id", "record_ids", "enabled")
+_LEGACY_TOP_LEVEL_TODO_KEYS = ("todo_channel_id", "todo_category_id", "todo_board_messages")
+
+
+def _str_keyed(value: Any) -> Dict[str, Any]:
+    """
+    A legacy id-keyed map with its keys as strings; non-dicts become empty.
+    """
+    if not isinstance(value, dict):
+        return {}
+    return {str(k): v for k, v in value.items()}
 
 
 def _snowflake_str(value: Any) -> Optional[str]:
     if value is None:
         return None
+    # Stored ids are already canonical digit strings; int() would only hand
+    # the same string back. Anything else (leading zeros, signs, spaces,
+    # non-ASCII digits, bools) takes the general path.
+    if type(value) is str:
+        if value.isascii() and value.isdigit() and (value[0] != "0" or value == "0"):
+            return value
+    elif type(value) is int:
+        return str(value)
     try:
         return str(int(value))
     except Exception:
         return None
 
 
+def _rewrite_snowflakes(value: Any, names: Tuple[str, ...]) -> Any:
+    """
+    Coerce the named snowflake fields of an input dict to strings in one
+    pass, on a copy so the caller's dict is left untouched.
+    """
+    if not isinstance(value, dict):
+        return value
+    data: Optional[Dict[str, Any]] = None
+    for name in names:
+        if name in value:
+            if data is None:
+                data = dict(value)
+            data[name] = _snowflake_str(value[name])
+    return value if data is None else data
+
+
 class UPSConfigModel(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     enabled: bool = True
     poll_seconds: int = 30
@@ -32,7 +83,7 @@ class UPSConfigModel(BaseModel):
 
 
 class UPSConfigPatchModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     enabled: Optional[bool] = None
     poll_seconds: Optional[int] = None
@@ -49,7 +100,7 @@ class UPSConfigPatchModel(BaseModel):
 
 
 class NotificationsPatchModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     guild_channels: Optional[Dict[str, str]] = None
 
@@ -60,10 +111,11 @@ class NotificationsPatchModel(BaseModel):
             return None
         if not isinstance(value, dict):
             return {}
+        sf = _snowflake_str
         out: Dict[str, str] = {}
         for raw_guild_id, raw_channel_id in value.items():
-            guild_id = _snowflake_str(raw_guild_id)
-            channel_id = _snowflake_str(raw_channel_id)
+            guild_id = sf(raw_guild_id)
+            channel_id = sf(raw_channel_id)
             if guild_id is None or channel_id is None:
                 continue
             out[guild_id] = channel_id
@@ -71,7 +123,7 @@ class NotificationsPatchModel(BaseModel):
 
 
 class CloudflarePatchModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     api_token: Optional[str] = None
     api_key: Optional[str] = None
@@ -94,90 +146,126 @@ class CloudflarePatchModel(BaseModel):
             return None
         if not isinstance(value, list):
             return []
-        out: list[str] = []
-        for raw in value:
-            if raw is None:
-                continue
-            out.append(str(raw))
-        return out
+        return [str(raw) for raw in value if raw is not None]
 
 
-class TodoTaskModel(BaseModel):
-    model_config = ConfigDict(extra="allow")
+# Leaf records are validated as TypedDicts: callers only ever see the dumped
+# dicts, so building a BaseModel instance per task / record buys nothing.
+# Defaults and coercions are applied by the before-validators below, which
+# put declared keys first and extras after, as a model dump would.
 
-    id: int = 0
-    title: str = "Untitled"
-    notes: str = ""
-    status: str = "open"
-    done: bool = False
-    assignee_ids: list[str] = Field(default_factory=list)
-    assignee_id: Optional[str] = None
-    thread_id: Optional[str] = None
-    created_by: Optional[str] = None
-    created_at: str = ""
+def _snowflake_record(names: Tuple[str, ...]) -> Callable[[Any], Any]:
+    """
+    Before-validator for a record of optional snowflake fields: missing ones
+    default to None, present ones are coerced to strings.
+    """
 
-    @field_validator("status", mode="before")
-    @classmethod
-    def _normalize_status(cls, value: Any) -> str:
-        if not isinstance(value, str):
-            return "open"
-        if value in {"open", "in_progress", "done"}:
+    def normalize(value: Any) -> Any:
+        if not isinstance(value, dict):
             return value
-        return "open"
+        rec = dict.fromkeys(names)
+        rec.update(value)
+        sf = _snowflake_str
+        for name in names:
+            rec[name] = sf(rec[name])
+        return rec
+
+    return normalize
+
+
+_TASK_STATUSES = frozenset({"open", "in_progress", "done"})
+
+
+def _normalize_task(value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    task = {
+        "id": 0,
+        "title": "Untitled",
+        "notes": "",
+        "status": "open",
+        "done": False,
+        "assignee_ids": [],
+        "assignee_id": None,
+        "thread_id": None,
+        "created_by": None,
+        "created_at": "",
+        **value,
+    }
+    status = task["status"]
+    if not isinstance(status, str) or status not in _TASK_STATUSES:
+        task["status"] = "open"
+    ids = task["assignee_ids"]
+    sf = _snowflake_str
+    task["assignee_ids"] = (
+        [sid for sid in map(sf, ids) if sid is not None] if isinstance(ids, list) else []
+    )
+    task["assignee_id"] = sf(task["assignee_id"])
+    task["thread_id"] = sf(task["thread_id"])
+    task["created_by"] = sf(task["created_by"])
+    return task
 
-    @field_validator("assignee_ids", mode="before")
-    @classmethod
-    def _normalize_assignee_ids(cls, value: Any) -> list[str]:
-        if not isinstance(value, list):
-            return []
-        out: list[str] = []
-        for raw in value:
-            sf = _snowflake_str(raw)
-            if sf is not None:
-                out.append(sf)
-        return out
 
-    @field_validator("assignee_id", "thread_id", "created_by", mode="before")
-    @classmethod
-    def _normalize_optional_snowflake(cls, value: Any) -> Optional[str]:
-        return _snowflake_str(value)
+@with_config(ConfigDict(extra="allow"))
+class TodoTaskDict(TypedDict):
+    id: int
+    title: str
+    notes: str
+    status: str
+    done: bool
+    assignee_ids: list[str]
+    assignee_id: Optional[str]
+    thread_id: Optional[str]
+    created_by: Optional[str]
+    created_at: str
 
 
-class TodoGuildRecordModel(BaseModel):
-    model_config = ConfigDict(extra="allow")
+@with_config(ConfigDict(extra="allow"))
+class TodoGuildRecordDict(TypedDict):
+    category_id: Optional[str]
+    hub_channel_id: Optional[str]
+    hub_message_id: Optional[str]
 
-    category_id: Optional[str] = None
-    hub_channel_id: Optional[str] = None
-    hub_message_id: Optional[str] = None
 
-    @field_validator("category_id", "hub_channel_id", "hub_message_id", mode="before")
-    @classmethod
-    def _normalize_optional_snowflake(cls, value: Any) -> Optional[str]:
-        return _snowflake_str(value)
+TodoTask = Annotated[TodoTaskDict, BeforeValidator(_normalize_task)]
+TodoGuildRecord = Annotated[
+    TodoGuildRecordDict,
+    BeforeValidator(_snowflake_record(("category_id", "hub_channel_id", "hub_message_id"))),
+]
 
 
 class TodoListRecordModel(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     guild_id: Optional[str] = None
     board_message_id: Optional[str] = None
-    tasks: list[TodoTaskModel] = Field(default_factory=list)
+    tasks: list[TodoTask] = Field(default_factory=list)
+
+    _SNOWFLAKE_FIELDS: ClassVar[Tuple[str, ...]] = ("guild_id", "board_message_id")
 
-    @field_validator("guild_id", "board_message_id", mode="before")
+    @model_validator(mode="before")
     @classmethod
-    def _normalize_optional_snowflake(cls, value: Any) -> Optional[str]:
-        return _snowflake_str(value)
+    def _normalize_snowflakes(cls, value: Any) -> Any:
+        return _rewrite_snowflakes(value, cls._SNOWFLAKE_FIELDS)
 
 
 class TodoConfigModel(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
-    guilds: Dict[str, TodoGuildRecordModel] = Field(default_factory=dict)
+    guilds: Dict[str, TodoGuildRecord] = Field(default_factory=dict)
     lists: Dict[str, TodoListRecordModel] = Field(default_factory=dict)
 
     @model_validator(mode="before")
     @classmethod
     def _migrate_legacy(cls, value: Any) -> Dict[str, Any]:
+        if (
+            isinstance(value, dict)
+            and isinstance(value.get("guilds"), dict)
+            and isinstance(value.get("lists"), dict)
+            and not any(k in value for k in _LEGACY_TODO_KEYS)
+        ):
+            return value
+
         data = dict(value) if isinstance(value, dict) else {}
 
         guilds = data.get("guilds")
@@ -187,61 +275,51 @@ class TodoConfigModel(BaseModel):
         if not isinstance(lists, dict):
             lists = {}
 
-        old_categories = data.get("categories", {})
-        old_hubs = data.get("hubs", {})
-        old_hub_messages = data.get("hub_messages", {})
-        old_board_messages = data.get("board_messages", {})
-        old_tasks = data.get("tasks", {})
-
-        if isinstance(old_categories, dict):
-            for g, cat_id in old_categories.items():
-                rec = guilds.get(str(g), {})
-                if not isinstance(rec, dict):
-                    rec = {}
-                rec.setdefault("category_id", cat_id)
+        categories = _str_keyed(data.get("categories"))
+        hubs = _str_keyed(data.get("hubs"))
+        hub_messages = _str_keyed(data.get("hub_messages"))
+        board_messages = _str_keyed(data.get("board_messages"))
+        tasks = _str_keyed(data.get("tasks"))
+
+        # One upsert per guild / list, in first-seen order across the maps.
+        for g in dict.fromkeys([*categories, *hubs, *hub_messages]):
+            rec = guilds.get(g)
+            if not isinstance(rec, dict):
+                guilds[g] = {
+                    "category_id": categories.get(g),
+                    "hub_channel_id": hubs.get(g),
+                    "hub_message_id": hub_messages.get(g),
+                }
+                continue
+            rec.setdefault("category_id", categories.get(g))
+            if g in hubs:
+                rec["hub_channel_id"] = hubs[g]
+            else:
                 rec.setdefault("hub_channel_id", None)
+            if g in hub_messages:
+                rec["hub_message_id"] = hub_messages[g]
+            else:
                 rec.setdefault("hub_message_id", None)
-                guilds[str(g)] = rec
-
-        if isinstance(old_hubs, dict):
-            for g, hub_id in old_hubs.items():
-                rec = guilds.get(str(g), {})
-                if not isinstance(rec, dict):
-                    rec = {}
-                rec.setdefault("category_id", None)
-                rec["hub_channel_id"] = hub_id
-                rec.setdefault("hub_message_id", None)
-                guilds[str(g)] = rec
-
-        if isinstance(old_hub_messages, dict):
-            for g, msg_id in old_hub_messages.items():
-                rec = guilds.get(str(g), {})
-                if not isinstance(rec, dict):
-                    rec = {}
-                rec.setdefault("category_id", None)
-                rec.setdefault("hub_channel_id", None)
-                rec["hub_message_id"] = msg_id
-                guilds[str(g)] = rec
-
-        if isinstance(old_board_messages, dict):
-            for ch, msg_id in old_board_messages.items():
-                rec = lists.get(str(ch), {})
-                if not isinstance(rec, dict):
-                    rec = {}
-                rec.setdefault("guild_id", None)
-                rec["board_message_id"] = msg_id
-                rec.setdefault("tasks", [])
-                lists[str(ch)] = rec
-
-        if isinstance(old_tasks, dict):
-            for ch, rows in old_tasks.items():
-                rec = lists.get(str(ch), {})
-                if not isinstance(rec, dict):
-                    rec = {}
-                rec.setdefault("guild_id", None)
+
+        for ch in dict.fromkeys([*board_messages, *tasks]):
+            rows = tasks.get(ch)
+            rec = lists.get(ch)
+            if not isinstance(rec, dict):
+                lists[ch] = {
+                    "guild_id": None,
+                    "board_message_id": board_messages.get(ch),
+                    "tasks": rows if isinstance(rows, list) else [],
+                }
+                continue
+            rec.setdefault("guild_id", None)
+            if ch in board_messages:
+                rec["board_message_id"] = board_messages[ch]
+            else:
                 rec.setdefault("board_message_id", None)
+            if ch in tasks:
                 rec["tasks"] = rows if isinstance(rows, list) else []
-                lists[str(ch)] = rec
+            else:
+                rec.setdefault("tasks", [])
 
         data["guilds"] = guilds
         data["lists"] = lists
@@ -259,7 +337,7 @@ class TodoConfigModel(BaseModel):
 
 
 class CloudflareConfigModel(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     api_token: Optional[str] = None
     api_key: Optional[str] = None
@@ -273,16 +351,11 @@ class CloudflareConfigModel(BaseModel):
     def _normalize_record_ids(cls, value: Any) -> list[str]:
         if not isinstance(value, list):
             return []
-        out: list[str] = []
-        for raw in value:
-            if raw is None:
-                continue
-            out.append(str(raw))
-        return out
+        return [str(raw) for raw in value if raw is not None]
 
 
 class NotificationsConfigModel(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     guild_channels: Dict[str, str] = Field(default_factory=dict)
 
@@ -291,40 +364,47 @@ class NotificationsConfigModel(BaseModel):
     def _normalize_guild_channels(cls, value: Any) -> Dict[str, str]:
         if not isinstance(value, dict):
             return {}
+        sf = _snowflake_str
         out: Dict[str, str] = {}
         for raw_guild_id, raw_channel_id in value.items():
-            guild_id = _snowflake_str(raw_guild_id)
-            channel_id = _snowflake_str(raw_channel_id)
+            guild_id = sf(raw_guild_id)
+            channel_id = sf(raw_channel_id)
             if guild_id is None or channel_id is None:
                 continue
             out[guild_id] = channel_id
         return out
 
 
-class PowerRestartNoticeModel(BaseModel):
-    model_config = ConfigDict(extra="allow")
-
-    channel_id: Optional[str] = None
-    guild_id: Optional[str] = None
-    message_id: Optional[str] = None
-    requested_by_user_id: Optional[str] = None
-    confirmed_by_user_id: Optional[str] = None
-
-    @field_validator(
-        "channel_id",
-        "guild_id",
-        "message_id",
-        "requested_by_user_id",
-        "confirmed_by_user_id",
-        mode="before",
-    )
-    @classmethod
-    def _normalize_optional_snowflake(cls, value: Any) -> Optional[str]:
-        return _snowflake_str(value)
-
-
-class RestartNoticeRuntimeModel(BaseModel):
-    model_config = ConfigDict(extra="ignore")
+@with_config(ConfigDict(extra="allow"))
+class PowerRestartNoticeDict(TypedDict):
+    channel_id: Optional[str]
+    guild_id: Optional[str]
+    message_id: Optional[str]
+    requested_by_user_id: Optional[str]
+    confirmed_by_user_id: Optional[str]
+
+
+PowerRestartNoticeRecord = Annotated[
+    PowerRestartNoticeDict,
+    BeforeValidator(
+        _snowflake_record(
+            (
+                "channel_id",
+                "guild_id",
+                "message_id",
+                "requested_by_user_id",
+                "confirmed_by_user_id",
+            )
+        )
+    ),
+]
+
+
+@dataclass(slots=True)
+class RestartNotice:
+    """
+    Read-side view of a stored power restart notice, used once at boot.
+    """
 
     channel_id: Optional[int] = None
     message_id: Optional[int] = None
@@ -335,39 +415,22 @@ class RestartNoticeRuntimeModel(BaseModel):
     requested_at_epoch: Optional[int] = None
     confirmed_at_epoch: Optional[int] = None
 
-    @field_validator("channel_id", "message_id", "requested_by_user_id", "confirmed_by_user_id", mode="before")
-    @classmethod
-    def _to_int_optional(cls, value: Any) -> Optional[int]:
-        if value is None:
-            return None
-        try:
-            return int(value)
-        except Exception:
-            return None
-
-    @field_validator("delay_seconds", mode="before")
     @classmethod
-    def _to_int_default_zero(cls, value: Any) -> int:
-        if value is None:
-            return 0
-        try:
-            return int(value)
-        except Exception:
-            return 0
-
-    @field_validator("requested_at_epoch", "confirmed_at_epoch", mode="before")
-    @classmethod
-    def _to_int_optional_epoch(cls, value: Any) -> Optional[int]:
-        if value is None:
-            return None
-        try:
-            return int(value)
-        except Exception:
-            return None
+    def from_mapping(cls, data: Mapping[str, Any]) -> "RestartNotice":
+        return cls(
+            channel_id=to_int_optional(data.get("channel_id")),
+            message_id=to_int_optional(data.get("message_id")),
+            delay_seconds=to_int(data.get("delay_seconds"), 0),
+            force=bool(data.get("force", False)),
+            requested_by_user_id=to_int_optional(data.get("requested_by_user_id")),
+            confirmed_by_user_id=to_int_optional(data.get("confirmed_by_user_id")),
+            requested_at_epoch=to_int_optional(data.get("requested_at_epoch")),
+            confirmed_at_epoch=to_int_optional(data.get("confirmed_at_epoch")),
+        )
 
 
 class PowerRestartNoticePatchModel(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", defer_build=True)
 
     action: Optional[str] = None
     channel_id: Optional[str] = None
@@ -380,37 +443,47 @@ class PowerRestartNoticePatchModel(BaseModel):
     delay_seconds: Optional[int] = None
     force: Optional[bool] = None
 
-    @field_validator(
+    _SNOWFLAKE_FIELDS: ClassVar[Tuple[str, ...]] = (
         "channel_id",
         "guild_id",
         "message_id",
         "requested_by_user_id",
         "confirmed_by_user_id",
-        mode="before",
     )
+
+    @model_validator(mode="before")
     @classmethod
-    def _normalize_optional_snowflake_fields(cls, value: Any) -> Optional[str]:
-        return _snowflake_str(value)
+    def _normalize_snowflakes(cls, value: Any) -> Any:
+        return _rewrite_snowflakes(value, cls._SNOWFLAKE_FIELDS)
 
 
 class CacheModel(BaseModel):
-    model_config = ConfigDict(extra="allow")
+    model_config = ConfigDict(extra="allow", defer_build=True)
 
     ups: UPSConfigModel = Field(default_factory=UPSConfigModel)
     todo_config: TodoConfigModel = Field(default_factory=TodoConfigModel)
     cloudflare: CloudflareConfigModel = Field(default_factory=CloudflareConfigModel)
     notifications: NotificationsConfigModel = Field(default_factory=NotificationsConfigModel)
-    power_restart_notice: Optional[PowerRestartNoticeModel] = None
+    power_restart_notice: Optional[PowerRestartNoticeRecord] = None
 
     @model_validator(mode="before")
     @classmethod
     def _migrate_legacy(cls, value: Any) -> Dict[str, Any]:
+        if (
+            isinstance(value, dict)
+            and isinstance(value.get("cloudflare"), dict)
+            and isinstance(value.get("todo_config"), dict)
+            and not any(k in value for k in _LEGACY_CLOUDFLARE_KEYS)
+            and not any(k in value for k in _LEGACY_TOP_LEVEL_TODO_KEYS)
+        ):
+            return value
+
         data = dict(value) if isinstance(value, dict) else {}
 
         cloudflare = data.get("cloudflare")
         if not isinstance(cloudflare, dict):
             cloudflare = {}
-        for key in ("api_token", "api_key", "email", "zone_id", "record_ids", "enabled"):
+        for key in _LEGACY_CLOUDFLARE_KEYS:
             if key not in cloudflare and key in data:
                 cloudflare[key] = data.get(key)
         data["cloudflare"] = cloudflare
@@ -419,38 +492,58 @@ class CacheModel(BaseModel):
             data["todo_config"] = {}
 
         # Drop legacy top-level todo keys that caused confusion.
-        data.pop("todo_channel_id", None)
-        data.pop("todo_category_id", None)
-        data.pop("todo_board_messages", None)
+        for key in _LEGACY_TOP_LEVEL_TODO_KEYS:
+            data.pop(key, None)
         return data
 
 
+# Every model above defers its schema build. Only the entry-point models are
+# built, here at import: nested models are compiled into CacheModel's schema
+# rather than each building a validator of its own that is never called.
+for _model in (
+    CacheModel,
+    UPSConfigPatchModel,
+    NotificationsPatchModel,
+    CloudflarePatchModel,
+    PowerRestartNoticePatchModel,
+):
+    _model.model_rebuild(force=True)
+del _model
+
+# Core validators / serializers bound once at import, so each normalize call
+# goes straight to pydantic-core without re-resolving them on the model.
+_CACHE_VALIDATE = CacheModel.__pydantic_validator__.validate_python
+_CACHE_DUMP = CacheModel.__pydantic_serializer__.to_python
+_UPS_PATCH_VALIDATE = UPSConfigPatchModel.__pydantic_validator__.validate_python
+_UPS_PATCH_DUMP = UPSConfigPatchModel.__pydantic_serializer__.to_python
+_NOTIFICATIONS_PATCH_VALIDATE = NotificationsPatchModel.__pydantic_validator__.validate_python
+_NOTIFICATIONS_PATCH_DUMP = NotificationsPatchModel.__pydantic_serializer__.to_python
+_CLOUDFLARE_PATCH_VALIDATE = CloudflarePatchModel.__pydantic_validator__.validate_python
+_CLOUDFLARE_PATCH_DUMP = CloudflarePatchModel.__pydantic_serializer__.to_python
+_RESTART_NOTICE_PATCH_VALIDATE = PowerRestartNoticePatchModel.__pydantic_validator__.validate_python
+_RESTART_NOTICE_PATCH_DUMP = PowerRestartNoticePatchModel.__pydantic_serializer__.to_python
+
+
 def normalize_cache_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    model = CacheModel.model_validate(data if isinstance(data, dict) else {})
-    return model.model_dump(mode="json", exclude_none=False)
+    model = _CACHE_VALIDATE(data if isinstance(data, dict) else {})
+    return _CACHE_DUMP(model, mode="json", exclude_none=False)
 
 
 def normalize_ups_patch(patch: Dict[str, Any]) -> Dict[str, Any]:
-    model = UPSConfigPatchModel.model_validate(patch if isinstance(patch, dict) else {})
-    return model.model_dump(mode="json", exclude_none=True)
+    model = _UPS_PATCH_VALIDATE(patch if isinstance(patch, dict) else {})
+    return _UPS_PATCH_DUMP(model, mode="json", exclude_none=True)
 
 
 def normalize_notifications_patch(patch: Dict[str, Any]) -> Dict[str, Any]:
-    model = NotificationsPatchModel.model_validate(
-        patch if isinstance(patch, dict) else {}
-    )
-    return model.model_dump(mode="json", exclude_none=True)
+    model = _NOTIFICATIONS_PATCH_VALIDATE(patch if isinstance(patch, dict) else {})
+    return _NOTIFICATIONS_PATCH_DUMP(model, mode="json", exclude_none=True)
 
 
 def normalize_cloudflare_patch(patch: Dict[str, Any]) -> Dict[str, Any]:
-    model = CloudflarePatchModel.model_validate(
-        patch if isinstance(patch, dict) else {}
-    )
-    return model.model_dump(mode="json", exclude_none=True)
+    model = _CLOUDFLARE_PATCH_VALIDATE(patch if isinstance(patch, dict) else {})
+    return _CLOUDFLARE_PATCH_DUMP(model, mode="json", exclude_none=True)
 
 
 def normalize_power_restart_notice_patch(patch: Dict[str, Any]) -> Dict[str, Any]:
-    model = PowerRestartNoticePatchModel.model_validate(
-        patch if isinstance(patch, dict) else {}
-    )
-    return model.model_dump(mode="json", exclude_none=True)
+    model = _RESTART_NOTICE_PATCH_VALIDATE(patch if isinstance(patch, dict) else {})
+    return _RESTART_NOTICE_PATCH_DUMP(model, mode="json", exclude_none=True)
@@ -1,10 +1,9 @@
 # mitra_bot/storage/cache_store.py
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, Optional, Set
+from typing import Any, ContextManager, Dict, Optional, Set
 
 from mitra_bot.storage.cache_repository import CacheRepository
 from mitra_bot.storage.cache_schema import (
@@ -27,23 +26,30 @@ def write_cache_json(data: Dict[str, Any]) -> None:
     _CACHE_REPO.write(data)
 
 
+def cache_batch() -> ContextManager[None]:
+    """
+    Coalesce cache.json writes made inside the block into one write on exit.
+    """
+    return _CACHE_REPO.batch()
+
+
 def read_cache_with_defaults() -> Dict[str, Any]:
     """
     Load cache.json and apply schema defaults/migrations. Writes back if updated.
+
+    Normalization is cached until cache.json changes on disk; callers get
+    their own copy and may mutate it.
     """
-    data = _CACHE_REPO.read_raw()
-    before = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return _CACHE_REPO.read_normalized(copy_result=True, persist=True)
 
-    data = normalize_cache_data(data)
 
-    after = json.dumps(data, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
-    if after != before:
-        try:
-            _CACHE_REPO.write(data)
-        except Exception:
-            logging.exception("Failed to write cache defaults to cache.json")
+def _read_cache_view() -> Dict[str, Any]:
+    """
+    Like read_cache_with_defaults(), but returns the shared cached dict.
 
-    return data
+    Read-only: getters built on it hand out shallow copies of what they return.
+    """
+    return _CACHE_REPO.read_normalized(copy_result=False, persist=True)
 
 
 # -----------------------------
@@ -110,9 +116,9 @@ async def save_ip(ip: str) -> None:
 # -----------------------------
 
 def get_ups_config() -> Dict[str, Any]:
-    data = read_cache_with_defaults()
+    data = _read_cache_view()
     ups = data.get("ups", {})
-    return ups if isinstance(ups, dict) else {}
+    return dict(ups) if isinstance(ups, dict) else {}
 
 
 def set_ups_config(patch: Dict[str, Any]) -> Dict[str, Any]:
@@ -131,9 +137,9 @@ def set_ups_config(patch: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def get_cloudflare_config() -> Dict[str, Any]:
-    data = read_cache_with_defaults()
+    data = _read_cache_view()
     cfg = data.get("cloudflare", {})
-    return cfg if isinstance(cfg, dict) else {}
+    return dict(cfg) if isinstance(cfg, dict) else {}
 
 
 def set_cloudflare_config(patch: Dict[str, Any]) -> Dict[str, Any]:
@@ -149,7 +155,7 @@ def set_cloudflare_config(patch: Dict[str, Any]) -> Dict[str, Any]:
 
 
 def get_notification_channel_id_for_guild(guild_id: int) -> Optional[int]:
-    data = read_cache_with_defaults()
+    data = _read_cache_view()
     notifications = data.get("notifications", {})
     if not isinstance(notifications, dict):
         notifications = {}
@@ -197,7 +203,7 @@ def clear_notification_channel_id_for_guild(guild_id: int) -> None:
 
 
 def get_notification_channel_map() -> Dict[int, int]:
-    data = read_cache_with_defaults()
+    data = _read_cache_view()
     notifications = data.get("notifications", {})
     if not isinstance(notifications, dict):
         return {}
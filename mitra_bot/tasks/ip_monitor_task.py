@@ -4,8 +4,9 @@ from __future__ import annotations
 import asyncio
 import ipaddress
 import logging
-from typing import Optional
+from typing import Any, Optional
 
+import aiohttp
 import discord
 from discord.ext import tasks
 from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
@@ -69,12 +70,25 @@ class IPMonitorTask:
     Background loop that checks public IP and notifies subscribers on change.
     """
 
-    def __init__(self, bot: discord.Bot, *, interval_seconds: int = 60) -> None:
+    def __init__(
+        self,
+        bot: discord.Bot,
+        *,
+        interval_seconds: int = 60,
+        session: Optional[aiohttp.ClientSession] = None,
+    ) -> None:
         self.bot = bot
         self.interval_seconds = interval_seconds
+        # Bot-lifetime HTTP session for Cloudflare calls, owned by the caller.
+        self.session = session
 
         self._last_ip: Optional[str] = None
 
+        # Kept across IP changes; rebuilt only when credentials change.
+        # The HTTP session it uses is bot-scoped and closed by main_async.
+        self._cf_service: Optional[CloudflareService] = None
+        self._cf_auth: Optional[tuple[str, str, str]] = None
+
         # bind loop
         self.loop.change_interval(seconds=self.interval_seconds)
 
@@ -112,40 +126,60 @@ class IPMonitorTask:
             )
             return
 
-        ip_version = ipaddress.ip_address(ip).version
+        service = self._get_cloudflare_service(cfg)
+        updated = await self._apply_dns_updates(service, cfg, ip)
+
+        logging.info("Cloudflare DNS update complete. Updated %s record(s).", updated)
 
-        service = CloudflareService(
+    def _get_cloudflare_service(
+        self, cfg: CloudflareDNSUpdateConfig
+    ) -> CloudflareService:
+        auth = (cfg.api_token, cfg.api_key, cfg.email)
+        if self._cf_service is not None and self._cf_auth == auth:
+            return self._cf_service
+
+        self._cf_service = CloudflareService(
             api_token=cfg.api_token or None,
             api_key=cfg.api_key or None,
             email=cfg.email or None,
+            session=self.session,
         )
-        records = await asyncio.to_thread(service.get_dns_records, cfg.zone_id)
-        records_by_id = {str(r.get("id", "")): r for r in records}
+        self._cf_auth = auth
+        return self._cf_service
+
+    async def _apply_dns_updates(
+        self,
+        service: CloudflareService,
+        cfg: CloudflareDNSUpdateConfig,
+        ip: str,
+    ) -> int:
+        ip_version = ipaddress.ip_address(ip).version
+        wanted_type = "A" if ip_version == 4 else "AAAA"
 
-        updated = 0
+        # Listed without a type filter so a configured record of the other
+        # family is told apart from one that is really missing (dual-stack
+        # configs list both A and AAAA ids).
+        records = await service.get_dns_records(cfg.zone_id)
+        records_by_id = {r.id: r for r in records}
+
+        updates: list[dict[str, Any]] = []
         for record_id in cfg.record_ids:
             record = records_by_id.get(record_id)
-            if not record:
+            if record is None:
                 logging.warning("Cloudflare record_id not found in zone: %s", record_id)
                 continue
 
-            record_type = str(record.get("type", "")).upper()
-            if ip_version == 4 and record_type != "A":
-                logging.info(
-                    "Skipping record %s (%s): public IP is IPv4.",
-                    record_id,
-                    record_type,
-                )
-                continue
-            if ip_version == 6 and record_type != "AAAA":
+            record_type = record.type.upper()
+            if record_type != wanted_type:
                 logging.info(
-                    "Skipping record %s (%s): public IP is IPv6.",
+                    "Skipping record %s (%s): public IP is IPv%s.",
                     record_id,
                     record_type,
+                    ip_version,
                 )
                 continue
 
-            record_name = str(record.get("name", "")).strip()
+            record_name = record.name.strip()
             if not record_name:
                 logging.warning(
                     "Skipping record %s: missing record name in Cloudflare response.",
@@ -153,30 +187,50 @@ class IPMonitorTask:
                 )
                 continue
 
-            ttl_raw = record.get("ttl", 1)
-            try:
-                ttl = int(ttl_raw)
-            except Exception:
-                ttl = 1
-
-            proxied = bool(record.get("proxied", False))
-            await asyncio.to_thread(
-                service.update_dns_record,
-                cfg.zone_id,
-                record_id,
-                name=record_name,
-                record_type=record_type,
-                content=ip,
-                ttl=ttl,
-                proxied=proxied,
+            if record.content == ip:
+                logging.info(
+                    "Skipping record %s (%s): already points at %s.",
+                    record_id,
+                    record_name,
+                    ip,
+                )
+                continue
+
+            ttl = record.ttl
+            proxied = bool(record.proxied)
+            updates.append(
+                {
+                    "record_id": record_id,
+                    "name": record_name,
+                    "record_type": record_type,
+                    "content": ip,
+                    "ttl": ttl,
+                    "proxied": proxied,
+                }
             )
+
+        if not updates:
+            return 0
+
+        results = await service.batch_update_dns_records(cfg.zone_id, updates)
+
+        updated = 0
+        for update, result in zip(updates, results):
+            if isinstance(result, BaseException):
+                logging.error(
+                    "Failed to update Cloudflare record %s (%s): %s",
+                    update["record_id"],
+                    update["name"],
+                    result,
+                )
+                continue
             updated += 1
 
-        logging.info("Cloudflare DNS update complete. Updated %s record(s).", updated)
+        return updated
 
     @tasks.loop(seconds=60)
     async def loop(self) -> None:
-        ip = get_public_ip()
+        ip = await asyncio.to_thread(get_public_ip)
         if not ip:
             return
 
@@ -7,13 +7,14 @@ import discord
 from discord.ext import tasks
 
 from mitra_bot.services.notifier import Notifier
-from mitra_bot.storage.cache_store import read_cache_with_defaults
+from mitra_bot.storage.cache_store import get_ups_config
 
 
 class UPSMonitorTask:
     def __init__(self, bot: discord.Bot, *, poll_seconds: int = 30) -> None:
         self.bot = bot
         self.poll_seconds = poll_seconds
+        self.notifier = Notifier(bot)
         self.loop.change_interval(seconds=self.poll_seconds)
 
     async def start(self) -> None:
@@ -21,9 +22,10 @@ class UPSMonitorTask:
 
     @tasks.loop(seconds=30)
     async def loop(self) -> None:
-        cfg = read_cache_with_defaults()
-        ups_cfg = cfg.get("ups", {}) if isinstance(cfg.get("ups"), dict) else {}
+        ups_cfg = get_ups_config()
 
+        # Keep ticking at the poll interval while disabled so /ups enable
+        # takes effect on the next tick; the check is a cached cache read.
         if not bool(ups_cfg.get("enabled", True)):
             return
 
@@ -33,7 +35,7 @@ class UPSMonitorTask:
             return
 
         try:
-            event = cog.poll_for_event()  # type: ignore[attr-defined]
+            event = await cog.poll_for_event()  # type: ignore[attr-defined]
         except Exception:
             logging.exception("UPS poll failed.")
             return
@@ -44,12 +46,10 @@ class UPSMonitorTask:
         await self._dispatch_event(event.message)
 
     async def _dispatch_event(self, message: str) -> None:
-        notifier = Notifier(self.bot)
-
         channel_id = getattr(getattr(self.bot, "state", None), "channel_id", None)
         subscribers = getattr(getattr(self.bot, "state", None), "subscribers", set())
 
-        await notifier.notify(
+        await self.notifier.notify(
             channel_id=channel_id,
             subscriber_ids=subscribers,
             message=message,
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from typing import Any, Dict
+
+from mitra_bot.storage.cache_repository import CacheRepository
+
+
+class CacheRepositoryTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.path = Path(self._tmp.name) / "cache.json"
+        self.calls = 0
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def _normalize(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        self.calls += 1
+        return {"version": 1, **data}
+
+    def test_read_normalized_is_cached_until_write(self) -> None:
+        self.path.write_text(json.dumps({"ip": "1.1.1.1"}), encoding="utf-8")
+        repo = CacheRepository(self.path, self._normalize)
+
+        first = repo.read_normalized()
+        self.assertIs(repo.read_normalized(), first)
+        self.assertEqual(self.calls, 1)
+
+        copied = repo.read_normalized(copy_result=True)
+        copied["ip"] = "changed"
+        self.assertEqual(repo.read_normalized()["ip"], "1.1.1.1")
+
+        repo.write({"ip": "2.2.2.2"})
+        self.assertEqual(repo.read_normalized()["ip"], "2.2.2.2")
+        # The write seeds the cache; the file is not normalized again.
+        self.assertEqual(self.calls, 2)
+
+    def test_persist_writes_back_normalized_data(self) -> None:
+        self.path.write_text(json.dumps({"ip": "1.1.1.1"}), encoding="utf-8")
+        repo = CacheRepository(self.path, self._normalize)
+
+        repo.read_normalized(persist=True)
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["version"], 1)
+
+    def test_write_skips_identical_payload(self) -> None:
+        repo = CacheRepository(self.path, self._normalize)
+        repo.write({"ip": "1.1.1.1"})
+        os.utime(self.path, ns=(1, 1))
+
+        repo.write({"ip": "1.1.1.1"})
+        self.assertEqual(self.path.stat().st_mtime_ns, 1)
+
+        repo.write({"ip": "2.2.2.2"})
+        self.assertNotEqual(self.path.stat().st_mtime_ns, 1)
+
+    def test_write_of_unchanged_data_skips_normalizer(self) -> None:
+        repo = CacheRepository(self.path, self._normalize)
+        repo.write({"ip": "1.1.1.1"})
+        self.assertEqual(self.calls, 1)
+
+        repo.write(repo.read_normalized(copy_result=True))
+        self.assertEqual(self.calls, 1)
+
+        repo.mutate(lambda d: d.update(ip="2.2.2.2"), normalize_read=True)
+        self.assertEqual(self.calls, 2)
+
+    def test_batch_coalesces_writes(self) -> None:
+        repo = CacheRepository(self.path, self._normalize)
+        with repo.batch():
+            repo.write({"ip": "1.1.1.1"})
+            repo.mutate(lambda d: d.update(ip="2.2.2.2"))
+            self.assertFalse(self.path.exists())
+            self.assertEqual(repo.read_normalized()["ip"], "2.2.2.2")
+
+        self.assertEqual(json.loads(self.path.read_text(encoding="utf-8"))["ip"], "2.2.2.2")
+
+
+if __name__ == "__main__":
+    unittest.main()
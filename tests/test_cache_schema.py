@@ -3,6 +3,7 @@ from __future__ import annotations
 import unittest
 
 from mitra_bot.storage.cache_schema import (
+    RestartNotice,
     normalize_cache_data,
     normalize_notifications_patch,
     normalize_power_restart_notice_patch,
@@ -70,6 +71,17 @@ class CacheSchemaTests(unittest.TestCase):
         self.assertEqual(out["requested_by_user_id"], "4")
         self.assertEqual(out["confirmed_by_user_id"], "5")
 
+    def test_restart_notice_round_trips_stored_patch(self) -> None:
+        stored = normalize_power_restart_notice_patch(
+            {"channel_id": 1474199874982510800, "message_id": 3, "force": True}
+        )
+        notice = RestartNotice.from_mapping(stored)
+        self.assertEqual(notice.channel_id, 1474199874982510800)
+        self.assertEqual(notice.message_id, 3)
+        self.assertEqual(notice.delay_seconds, 0)
+        self.assertTrue(notice.force)
+        self.assertIsNone(notice.requested_at_epoch)
+
 
 if __name__ == "__main__":
     unittest.main()
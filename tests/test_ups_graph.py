@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import unittest
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from mitra_bot.services.ups.ups_graph import _lttb_indices, _welford_mean_std
+from mitra_bot.services.ups.ups_graph_svg import SVGPanel, build_status_svg
+
+
+class LTTBTests(unittest.TestCase):
+    def test_keeps_endpoints_and_requested_count(self) -> None:
+        x = np.arange(1000, dtype=np.float64)
+        y = np.sin(x / 25.0)
+        idx = _lttb_indices(x, y, 100)
+        self.assertEqual(len(idx), 100)
+        self.assertEqual(idx[0], 0)
+        self.assertEqual(idx[-1], 999)
+        self.assertTrue(np.all(np.diff(idx) > 0))
+
+    def test_preserves_spike(self) -> None:
+        x = np.arange(500, dtype=np.float64)
+        y = np.zeros(500)
+        y[250] = 10.0
+        idx = _lttb_indices(x, y, 20)
+        self.assertIn(250, idx)
+
+    def test_short_series_is_untouched(self) -> None:
+        x = np.arange(10, dtype=np.float64)
+        np.testing.assert_array_equal(_lttb_indices(x, x, 50), np.arange(10))
+
+
+class WelfordTests(unittest.TestCase):
+    def test_matches_numpy_and_skips_nan(self) -> None:
+        y = np.array([1.0, np.nan, 4.0, 2.5, np.nan, 7.0])
+        count, mean, std = _welford_mean_std(y)
+        self.assertEqual(count, 4)
+        self.assertAlmostEqual(mean, float(np.nanmean(y)))
+        self.assertAlmostEqual(std, float(np.nanstd(y, ddof=1)))
+
+
+class StatusSVGTests(unittest.TestCase):
+    def test_splits_series_at_gaps_and_escapes_text(self) -> None:
+        x = np.arange(6, dtype=np.float64) * 60e6
+        y = np.array([1.0, 2.0, np.nan, 3.0, 4.0, 5.0])
+        svg = build_status_svg(
+            [SVGPanel(x=x, y=y, label="Output", units="W", mean=3.0, std=1.0)],
+            x_min=float(x[0]),
+            x_max=float(x[-1]),
+            title="UPS <test>",
+            x_label="Time",
+            theme={"fig_bg": "#000", "ax_bg": "#111", "text": "#fff", "grid": "#222", "accent": "#00f"},
+        )
+        root = ET.fromstring(svg)
+        polylines = root.findall("{http://www.w3.org/2000/svg}polyline")
+        self.assertEqual([len(p.get("points").split()) for p in polylines], [2, 3])
+        self.assertIn("UPS &lt;test&gt;", svg)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import tempfile
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from unittest import mock
+
+from mitra_bot.services.ups import ups_log
+from mitra_bot.services.ups.ups_log import UPSLogStore
+
+
+def _iso(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class UPSLogStoreTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.log_path = Path(self._tmp.name) / "ups.jsonl"
+
+    def tearDown(self) -> None:
+        self._tmp.cleanup()
+
+    def test_get_recent_filters_by_window(self) -> None:
+        now = datetime.now(timezone.utc)
+        store = UPSLogStore(log_file=str(self.log_path))
+        store.append({"ts": _iso(now - timedelta(hours=3)), "output_w": 1})
+        store.append({"ts": _iso(now - timedelta(minutes=5)), "output_w": 2})
+
+        rows = store.get_recent(hours=1)
+        self.assertEqual([r["output_w"] for r in rows], [2])
+        self.assertEqual(len(store.get_recent(hours=6)), 2)
+        store.close()
+
+    def test_appends_within_flush_interval_are_batched(self) -> None:
+        now = datetime.now(timezone.utc)
+        store = UPSLogStore(log_file=str(self.log_path), flush_interval_seconds=3600)
+        for i in range(3):
+            store.append({"ts": _iso(now - timedelta(minutes=3 - i)), "output_w": i})
+        self.assertFalse(self.log_path.exists())
+
+        store.flush()
+        self.assertEqual(len(self.log_path.read_text(encoding="utf-8").splitlines()), 3)
+        store.close()
+
+    def test_pending_rows_are_written_by_timer_without_further_appends(self) -> None:
+        store = UPSLogStore(log_file=str(self.log_path), flush_interval_seconds=0.05)
+        store.append({"ts": _iso(datetime.now(timezone.utc)), "output_w": 1})
+
+        deadline = time.monotonic() + 2.0
+        while time.monotonic() < deadline and not (
+            self.log_path.exists() and self.log_path.stat().st_size
+        ):
+            time.sleep(0.01)
+        self.assertEqual(len(self.log_path.read_text(encoding="utf-8").splitlines()), 1)
+        store.close()
+
+    def test_preload_recent_reads_rows_written_by_append(self) -> None:
+        now = datetime.now(timezone.utc)
+        writer = UPSLogStore(log_file=str(self.log_path))
+        writer.append({"ts": _iso(now - timedelta(hours=30)), "output_w": 1})
+        writer.append({"timestamp": _iso(now - timedelta(hours=1)), "output_w": 2})
+        writer.append({"output_w": 3})
+        writer.close()
+
+        lines = self.log_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual(len(lines), 3)
+        self.assertTrue(all("ts" in json.loads(line) for line in lines))
+
+        reader = UPSLogStore(log_file=str(self.log_path))
+        reader.preload_recent(hours=24)
+        self.assertEqual([r["output_w"] for r in reader.get_recent(hours=24)], [2, 3])
+
+    def test_preload_recent_handles_empty_file(self) -> None:
+        self.log_path.touch()
+        store = UPSLogStore(log_file=str(self.log_path))
+        store.preload_recent(hours=24)
+        self.assertEqual(store.get_recent(hours=24), [])
+
+    def test_preload_recent_keeps_newest_rows_up_to_history_limit(self) -> None:
+        now = datetime.now(timezone.utc)
+        writer = UPSLogStore(log_file=str(self.log_path))
+        for i in range(5):
+            writer.append({"ts": _iso(now - timedelta(minutes=5 - i)), "output_w": i})
+        writer.close()
+        with self.log_path.open("ab") as f:
+            f.write(b"not json\n")
+
+        reader = UPSLogStore(log_file=str(self.log_path), history_limit=3)
+        reader.preload_recent(hours=1)
+        self.assertEqual([r["output_w"] for r in reader.get_recent(hours=1)], [2, 3, 4])
+
+    def test_append_rotates_previous_day_into_gzip_archive(self) -> None:
+        now = datetime.now(timezone.utc)
+        yesterday = now - timedelta(days=1)
+        writer = UPSLogStore(log_file=str(self.log_path))
+        writer.append({"ts": _iso(now - timedelta(hours=20)), "output_w": 1})
+        writer.close()
+        os.utime(self.log_path, (yesterday.timestamp(), yesterday.timestamp()))
+
+        writer.append({"ts": _iso(now), "output_w": 2})
+        writer.close()
+
+        archive = Path(self._tmp.name) / f"ups-{yesterday.date().isoformat()}.jsonl.gz"
+        with gzip.open(archive, "rt", encoding="utf-8") as f:
+            self.assertEqual([json.loads(line)["output_w"] for line in f], [1])
+        self.assertEqual(len(self.log_path.read_text(encoding="utf-8").splitlines()), 1)
+
+        reader = UPSLogStore(log_file=str(self.log_path))
+        reader.preload_recent(hours=24)
+        self.assertEqual([r["output_w"] for r in reader.get_recent(hours=24)], [1, 2])
+
+    def test_batch_pending_across_midnight_rotates_by_append_day(self) -> None:
+        now = datetime.now(timezone.utc)
+        yesterday = (now - timedelta(days=1)).date()
+        store = UPSLogStore(log_file=str(self.log_path), flush_interval_seconds=3600)
+
+        with mock.patch.object(ups_log, "_utc_today", return_value=yesterday):
+            store.append({"ts": _iso(now - timedelta(minutes=2)), "output_w": 1})
+        self.assertFalse(self.log_path.exists())
+
+        # The first append of the new day writes yesterday's batch as-is.
+        with mock.patch.object(ups_log, "_utc_today", return_value=now.date()):
+            store.append({"ts": _iso(now), "output_w": 2})
+            self.assertEqual(len(self.log_path.read_text(encoding="utf-8").splitlines()), 1)
+            store.close()
+
+        archive = Path(self._tmp.name) / f"ups-{yesterday.isoformat()}.jsonl.gz"
+        with gzip.open(archive, "rt", encoding="utf-8") as f:
+            self.assertEqual([json.loads(line)["output_w"] for line in f], [1])
+        lines = self.log_path.read_text(encoding="utf-8").splitlines()
+        self.assertEqual([json.loads(line)["output_w"] for line in lines], [2])
+
+
+if __name__ == "__main__":
+    unittest.main()
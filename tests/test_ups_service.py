@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest import mock
+
+from mitra_bot.services.ups import ups_service
+from mitra_bot.services.ups.ups_log import UPSLogStore
+from mitra_bot.services.ups.ups_service import UPSConfig, UPSService
+
+
+class _ListLogStore:
+    def __init__(self) -> None:
+        self.rows: List[Dict[str, Any]] = []
+        self.flushed = 0
+
+    def append(self, row: Dict[str, Any]) -> None:
+        self.rows.append(row)
+
+    def flush(self) -> None:
+        self.flushed = len(self.rows)
+
+
+def _status(*, ac_present: bool = True, output_w: float = 100.0, tte: float = 3600.0) -> Dict[str, Any]:
+    return {
+        "status": {"ac present": ac_present},
+        "output": {"power": output_w, "voltage": 120.0},
+        "input": {"voltage": 121.0, "frequency": 60.0},
+        "time to empty": tte,
+    }
+
+
+def _service(store: Any, *, auto_shutdown: bool = False) -> UPSService:
+    return UPSService(
+        client=None,  # type: ignore[arg-type]
+        log_store=store,  # type: ignore[arg-type]
+        config=UPSConfig(
+            enabled=True,
+            warn_time_to_empty_seconds=600,
+            critical_time_to_empty_seconds=180,
+            auto_shutdown_enabled=auto_shutdown,
+            auto_shutdown_action="shutdown",
+            auto_shutdown_delay_seconds=0,
+            auto_shutdown_force=False,
+        ),
+    )
+
+
+class UPSServiceLogTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.store = _ListLogStore()
+        self.service = _service(self.store)
+
+    def test_unchanged_polls_are_not_logged(self) -> None:
+        self.service._process_status(_status())
+        self.service._process_status(_status(output_w=102.0))
+        self.assertEqual(len(self.store.rows), 1)
+
+        self.service._process_status(_status(output_w=120.0))
+        self.service._process_status(_status(ac_present=False))
+        self.assertEqual(len(self.store.rows), 3)
+
+    def test_heartbeat_logs_unchanged_row(self) -> None:
+        self.service._process_status(_status())
+        self.service._last_logged_at -= ups_service.LOG_HEARTBEAT_SECONDS
+        self.service._process_status(_status())
+        self.assertEqual(len(self.store.rows), 2)
+
+
+    def test_heartbeat_row_reaches_disk_within_flush_interval(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            log_path = Path(tmp) / "ups.jsonl"
+            store = UPSLogStore(log_file=str(log_path), flush_interval_seconds=0.05)
+            service = _service(store)
+            try:
+                service._process_status(_status())
+                store.flush()
+                service._last_logged_at -= ups_service.LOG_HEARTBEAT_SECONDS
+                service._process_status(_status())
+
+                # No further polls: the unchanged row is written by the
+                # store's timer, not by a later append.
+                deadline = time.monotonic() + 2.0
+                lines = 1
+                while time.monotonic() < deadline and lines < 2:
+                    time.sleep(0.01)
+                    lines = len(log_path.read_text(encoding="utf-8").splitlines())
+                self.assertEqual(lines, 2)
+            finally:
+                store.close()
+
+
+class UPSServiceStatusTests(unittest.TestCase):
+    def test_underscore_input_names_are_accepted(self) -> None:
+        store = _ListLogStore()
+        service = _service(store)
+        service._process_status(_status())
+
+        event = service._process_status(
+            {
+                "status": {
+                    "ac_present": False,
+                    "shutdown_imminent": True,
+                    "needs_replacement": False,
+                },
+                "time_to_empty": 500.0,
+            }
+        )
+        self.assertEqual(event.level, "warn")
+        row = store.rows[-1]
+        self.assertTrue(row["on_battery"])
+        self.assertTrue(row["shutdown_imminent"])
+        self.assertFalse(row["needs_replacement"])
+        self.assertEqual(row["time_to_empty_s"], 500.0)
+
+        # Runtime read from the underscore name drives the thresholds.
+        event = service._process_status({"status": {"ac_present": False}, "time_to_empty": 100.0})
+        self.assertEqual(event.level, "critical")
+
+
+class UPSServiceShutdownTests(unittest.TestCase):
+    def test_auto_shutdown_flushes_log_before_power_action(self) -> None:
+        store = _ListLogStore()
+        service = _service(store, auto_shutdown=True)
+        service._process_status(_status())
+        service._process_status(_status(ac_present=False, tte=3000.0))
+
+        def power(*args: Any, **kwargs: Any) -> str:
+            # The critical row is already written when the machine goes down.
+            self.assertEqual(store.flushed, len(store.rows))
+            return "scheduled"
+
+        with mock.patch.object(ups_service, "execute_power_action", side_effect=power) as p:
+            service._process_status(_status(ac_present=False, tte=100.0))
+        self.assertEqual(p.call_count, 1)
+        self.assertEqual(store.flushed, 3)
+
+    def test_failed_auto_shutdown_is_retried_on_next_critical_poll(self) -> None:
+        service = _service(_ListLogStore(), auto_shutdown=True)
+        service._process_status(_status())
+        service._process_status(_status(ac_present=False, tte=3000.0))
+
+        with mock.patch.object(
+            ups_service,
+            "execute_power_action",
+            side_effect=[RuntimeError("denied"), "scheduled"],
+        ) as power:
+            event = service._process_status(_status(ac_present=False, tte=100.0))
+            self.assertEqual(event.level, "critical")
+            self.assertEqual(power.call_count, 1)
+
+            # No second alert, but the shutdown is attempted again.
+            self.assertIsNone(service._process_status(_status(ac_present=False, tte=90.0)))
+            self.assertEqual(power.call_count, 2)
+
+            # Once issued, it is not repeated.
+            service._process_status(_status(ac_present=False, tte=80.0))
+            self.assertEqual(power.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()